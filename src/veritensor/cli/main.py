@@ -12,7 +12,8 @@ import requests
 import concurrent.futures
 import multiprocessing
 from pathlib import Path
-from typing import Optional, List, Tuple
+from collections import deque
+from typing import Optional, List, Tuple, Dict, Callable, Iterator
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -22,12 +23,16 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from veritensor.core.config import ConfigLoader, VeritensorConfig
 from veritensor.core.types import ScanResult
 from veritensor.core.cache import HashCache
-from veritensor.core.streaming import get_stream_for_path
+from veritensor.core.streaming import (
+    get_stream_for_path, in_memory_stream, advise_sequential, Readahead, PREFETCH_MIN_FILES
+)
 from veritensor.engines.hashing.calculator import calculate_sha256
 from veritensor.engines.hashing.readers import get_reader_for_file 
 from veritensor.engines.static.pickle_engine import scan_pickle_stream
 from veritensor.engines.static.keras_engine import scan_keras_file
 
+from veritensor.engines.static.rules import SignatureLoader, get_matcher
+
 # Robust import for rules
 try:
     from veritensor.engines.static.rules import is_license_restricted, is_match
@@ -35,7 +40,7 @@ except ImportError:
     from veritensor.engines.static.rules import is_license_restricted
     def is_match(repo, allowed): return False
 
-from veritensor.integrations.cosign import sign_container, is_cosign_available, generate_key_pair
+from veritensor.integrations.cosign import sign_containers, is_cosign_available, generate_key_pair
 from veritensor.integrations.huggingface import HuggingFaceClient
 from veritensor.engines.content.injection import scan_document, TEXT_EXTENSIONS, DOC_EXTS
 from veritensor.engines.static.notebook_engine import scan_notebook
@@ -60,6 +65,58 @@ DATASET_EXTS = {".parquet", ".csv", ".jsonl"}
 DEP_FILES = {"requirements.txt", "pyproject.toml", "Pipfile", "poetry.lock", "Pipfile.lock"}
 ALL_DOC_EXTS = TEXT_EXTENSIONS.union(DOC_EXTS)
 
+# --- ENGINE DISPATCH ---
+# Every handler takes (target, local_fh, file_hash, full_scan_dataset).
+# target is a Path for local files and the URI string for S3.
+def _run_pickle(target, local_fh, file_hash, full_scan) -> List[str]:
+    if local_fh is not None:
+        local_fh.seek(0)
+        with in_memory_stream(local_fh) as stream:
+            return scan_pickle_stream(stream, strict_mode=True)
+    with get_stream_for_path(str(target)) as f:
+        return scan_pickle_stream(f, strict_mode=True)
+
+def _run_keras(target, local_fh, file_hash, full_scan) -> List[str]:
+    return scan_keras_file(target)
+
+def _run_document(target, local_fh, file_hash, full_scan) -> List[str]:
+    return scan_document(target, file_hash=file_hash)
+
+def _run_notebook(target, local_fh, file_hash, full_scan) -> List[str]:
+    return scan_notebook(target)
+
+def _run_dataset(target, local_fh, file_hash, full_scan) -> List[str]:
+    return scan_dataset(target, full_scan=full_scan)
+
+def _run_dependencies(target, local_fh, file_hash, full_scan) -> List[str]:
+    return scan_dependencies(target)
+
+# (label, handler): label names the engine in the S3 warning; None = S3 supported.
+_PICKLE = (None, _run_pickle)
+_KERAS = ("Keras", _run_keras)
+_DOCUMENT = ("Documents", _run_document)
+_NOTEBOOK = ("Notebooks", _run_notebook)
+_DATASET = ("Datasets", _run_dataset)
+_DEPENDENCIES = ("Dependencies", _run_dependencies)
+
+# Extension routes are checked before filename routes (requirements.txt is a document).
+EXT_DISPATCH: Dict[str, Tuple[Optional[str], Callable]] = {
+    **{e: _DATASET for e in DATASET_EXTS},
+    **{e: _NOTEBOOK for e in NOTEBOOK_EXTS},
+    **{e: _DOCUMENT for e in ALL_DOC_EXTS},
+    **{e: _KERAS for e in KERAS_EXTS},
+    **{e: _PICKLE for e in PICKLE_EXTS},
+}
+NAME_DISPATCH: Dict[str, Tuple[Optional[str], Callable]] = {
+    "dockerfile": _DOCUMENT,
+    **{n: _DEPENDENCIES for n in DEP_FILES},
+}
+
+# Hash verification messages (formatted per mismatching file)
+LFS_POINTER_MAX_SIZE = 2048
+MSG_LFS_POINTER = "CRITICAL: Hash mismatch! Likely Git LFS pointer ({} b)."
+MSG_HASH_MISMATCH = "CRITICAL: Hash mismatch! File differs from '{}'"
+
 SEVERITY_LEVELS = {
     "LOW": 1,
     "MEDIUM": 2,
@@ -97,13 +154,41 @@ def check_severity(threats: List[str], threshold: str) -> bool:
                 return True
     return False
 
+def _iter_files(root: Path) -> Iterator[str]:
+    """
+    Yields paths of all files under root (same set as rglob + is_file).
+    os.scandir reuses the d_type from readdir, so no stat() per entry.
+    Symlinked directories are not descended into; symlinked files are yielded.
+    """
+    pending = deque([root])
+    while pending:
+        try:
+            with os.scandir(pending.popleft()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory: {e}")
+
 # --- WORKER FUNCTION ---
-def scan_worker(args: Tuple[str, VeritensorConfig, Optional[str], bool, bool, bool]) -> ScanResult:
+def _init_worker():
+    """Pool initializer: loads signatures and compiles the shared matchers once per process."""
+    SignatureLoader.get_globals()
+    get_matcher(SignatureLoader.get_prompt_injections())
+    get_matcher(SignatureLoader.get_suspicious_strings())
+
+
+def scan_worker(
+    args: Tuple[str, VeritensorConfig, Optional[str], bool, bool, bool, Optional[Dict[str, str]]]
+) -> ScanResult:
     """
     Independent worker function that scans a single file.
-    Args: (file_path_str, config, repo, ignore_license, full_scan_dataset, is_s3)
+    Args: (file_path_str, config, repo, ignore_license, full_scan_dataset, is_s3, remote_hashes)
+    remote_hashes is the repo manifest fetched once by the parent (None = not available).
     """
-    file_path_str, config, repo, ignore_license, full_scan_dataset, is_s3 = args
+    file_path_str, config, repo, ignore_license, full_scan_dataset, is_s3, remote_hashes = args
     
     if is_s3:
         file_name = file_path_str.split("/")[-1]
@@ -121,76 +206,45 @@ def scan_worker(args: Tuple[str, VeritensorConfig, Optional[str], bool, bool, bo
     scan_res.repo_id = repo 
 
     # --- A. Identity & Hashing ---
+    # Local files are opened once: the hasher rewinds the handle when done,
+    # so the pickle engine below reuses it instead of reading from a new open().
+    local_fh = None
     if not is_s3 and file_path:
         try:
-            file_hash = calculate_sha256(file_path)
+            local_fh = open(file_path, "rb")
+            advise_sequential(local_fh)
+            file_hash = calculate_sha256(local_fh)
             scan_res.file_hash = file_hash
             
-            if repo:
-                hf_client = HuggingFaceClient(token=config.hf_token)
-                verification = hf_client.verify_file_hash(repo, file_name, file_hash)
+            if repo and remote_hashes is not None:
+                verification = HuggingFaceClient.verify_against_manifest(remote_hashes, file_name, file_hash)
                 if verification == "VERIFIED":
                     scan_res.identity_verified = True
                 elif verification == "MISMATCH":
-                    file_size = file_path.stat().st_size
-                    if file_size < 2048:
-                        scan_res.add_threat(
-                            f"CRITICAL: Hash mismatch! Likely Git LFS pointer ({file_size} b)."
-                        )
+                    file_size = os.fstat(local_fh.fileno()).st_size
+                    if file_size < LFS_POINTER_MAX_SIZE:
+                        scan_res.add_threat(MSG_LFS_POINTER.format(file_size))
                     else:
-                        scan_res.add_threat(f"CRITICAL: Hash mismatch! File differs from '{repo}'")
+                        scan_res.add_threat(MSG_HASH_MISMATCH.format(repo))
         except Exception as e:
             scan_res.add_threat(f"CRITICAL: Hashing Error: {str(e)}")
 
     # --- B. Static Analysis ---
     try:
-        if ext in PICKLE_EXTS:
-            with get_stream_for_path(file_path_str) as f:
-                threats = scan_pickle_stream(f, strict_mode=True)
-                for t in threats: scan_res.add_threat(t)
-        
-        elif ext in KERAS_EXTS:
-            if is_s3:
-                scan_res.add_threat("WARNING: S3 scanning not supported for Keras yet.")
-            else:
-                if file_path:
-                    threats = scan_keras_file(file_path)
-                    for t in threats: scan_res.add_threat(t)
-        
-        elif ext in ALL_DOC_EXTS or filename_lower == "dockerfile":
-            if is_s3:
-                 scan_res.add_threat("WARNING: S3 scanning not supported for Documents yet.")
-            else:
-                if file_path:
-                    threats = scan_document(file_path)
-                    for t in threats: scan_res.add_threat(t)
-
-        elif ext in NOTEBOOK_EXTS:
-            if is_s3:
-                 scan_res.add_threat("WARNING: S3 scanning not supported for Notebooks yet.")
+        route = EXT_DISPATCH.get(ext) or NAME_DISPATCH.get(file_name) or NAME_DISPATCH.get(filename_lower)
+        if route:
+            label, handler = route
+            if is_s3 and label:
+                scan_res.add_threat(f"WARNING: S3 scanning not supported for {label} yet.")
             else:
-                if file_path:
-                    threats = scan_notebook(file_path)
-                    for t in threats: scan_res.add_threat(t)
-
-        elif ext in DATASET_EXTS:
-            if is_s3:
-                 scan_res.add_threat("WARNING: S3 scanning not supported for Datasets yet.")
-            else:
-                if file_path:
-                    threats = scan_dataset(file_path, full_scan=full_scan_dataset)
-                    for t in threats: scan_res.add_threat(t)
-        
-        elif file_name in DEP_FILES:
-            if is_s3:
-                 scan_res.add_threat("WARNING: S3 scanning not supported for Dependencies yet.")
-            else:
-                if file_path:
-                    threats = scan_dependencies(file_path)
-                    for t in threats: scan_res.add_threat(t)
+                threats = handler(file_path or file_path_str, local_fh, scan_res.file_hash, full_scan_dataset)
+                for t in threats: scan_res.add_threat(t)
 
     except Exception as e:
         scan_res.add_threat(f"CRITICAL: Engine Error: {str(e)}")
+    finally:
+        if local_fh is not None:
+            local_fh.close()
 
     # --- C. License Check ---
     if not is_s3 and file_path:
@@ -226,7 +280,7 @@ def scan_worker(args: Tuple[str, VeritensorConfig, Optional[str], bool, bool, bo
 def scan(
     path: str = typer.Argument(..., help="Path to model file, directory, or S3 URL"),
     repo: Optional[str] = typer.Option(None, "--repo", "-r", help="Hugging Face Repo ID"),
-    image: Optional[str] = typer.Option(None, help="Docker image tag to sign"),
+    image: Optional[List[str]] = typer.Option(None, help="Docker image tag to sign (repeat to sign several in one cosign call)"),
     
     ignore_license: bool = typer.Option(False, "--ignore-license", help="Do not fail on license violations"),
     ignore_malware: bool = typer.Option(False, "--ignore-malware", help="Do not fail on malware/policy violations"),
@@ -266,7 +320,7 @@ def scan(
         if local_path.is_file():
             files_to_scan.append(local_path)
         elif local_path.is_dir():
-            files_to_scan.extend([p for p in local_path.rglob("*") if p.is_file()])
+            files_to_scan.extend(_iter_files(local_path))
         else:
             console.print(f"[bold red]Error:[/bold red] Path {path} not found.")
             raise typer.Exit(code=1)
@@ -285,20 +339,31 @@ def scan(
         except NotImplementedError:
             jobs = 1
             
-    if len(files_to_scan) == 1:
-        jobs = 1
+    # No point in spawning more workers than there are files to scan
+    jobs = max(1, min(jobs, len(files_to_scan)))
+
+    # One manifest request per scan instead of one API round-trip per file
+    remote_hashes = None
+    if repo and not is_s3:
+        remote_hashes = HuggingFaceClient(token=config.hf_token).get_file_manifest(repo)
 
     tasks = []
     if not is_s3:
         for f in files_to_scan:
-            tasks.append((str(f), config, repo, ignore_license, full_scan, False))
+            tasks.append((str(f), config, repo, ignore_license, full_scan, False, remote_hashes))
     else:
-        tasks.append((path, config, repo, ignore_license, full_scan, True))
+        tasks.append((path, config, repo, ignore_license, full_scan, True, remote_hashes))
 
     # 3. Execution (Parallel)
     if not is_machine_output:
         console.print(f"[dim]🚀 Starting scan with {jobs} workers on {len(tasks)} files...[/dim]")
 
+    # Overlap disk reads with scanning: prefetch the next files of a large
+    # local batch while the workers are busy with the current ones.
+    readahead = None
+    if not is_s3 and len(tasks) >= PREFETCH_MIN_FILES:
+        readahead = Readahead([t[0] for t in tasks], window=jobs * 2).start()
+
     executor = None
     try:
         with Progress(
@@ -311,33 +376,51 @@ def scan(
         ) as progress:
             
             main_task = progress.add_task("Scanning...", total=len(tasks))
-            
-            executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
-            
-            future_to_file = {
-                executor.submit(scan_worker, task_args): task_args[0] 
-                for task_args in tasks
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_file):
-                file_p = future_to_file[future]
+
+            def _collect(file_p: str, run):
                 try:
-                    res = future.result()
+                    res = run()
                     results.append(res)
-                    
+
                     if res.file_hash and not is_s3:
                         hash_cache.set(Path(res.file_path), res.file_hash)
-                        
+
                 except Exception as exc:
                     err_res = ScanResult(file_path=file_p, status="FAIL")
                     err_res.add_threat(f"CRITICAL: Worker Crashed: {exc}")
                     results.append(err_res)
-                
+
+                if readahead:
+                    readahead.advance()
                 progress.advance(main_task)
 
+            if jobs == 1:
+                # Sequential fallback: a single worker gains nothing from a pool,
+                # but would still pay for process spawn and task pickling.
+                for task_args in tasks:
+                    _collect(task_args[0], lambda: scan_worker(task_args))
+            else:
+                # Warm up before the pool starts: forked workers inherit the parsed
+                # signatures and compiled matchers; spawned ones redo it once in
+                # the initializer instead of on their first file.
+                _init_worker()
+                executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker)
+
+                future_to_file = {
+                    executor.submit(scan_worker, task_args): task_args[0]
+                    for task_args in tasks
+                }
+
+                # as_completed() yields in completion order, so the progress bar
+                # moves as soon as any worker finishes.
+                for future in concurrent.futures.as_completed(future_to_file):
+                    _collect(future_to_file[future], future.result)
+
     finally:
         if executor:
             executor.shutdown(wait=True)
+        if readahead:
+            readahead.close()
         hash_cache.close()
 
     # 4. Analysis & Reporting (SMART FILTERING)
@@ -387,7 +470,7 @@ def scan(
     elif sbom_output:
         print(generate_sbom(results))
     elif json_output:
-        results_dicts = [r.__dict__ for r in results]
+        results_dicts = [r.to_dict() for r in results]
         print(json.dumps(results_dicts, indent=2))
     else:
         # Console gets filtered results
@@ -465,8 +548,8 @@ def _print_table(results: List[ScanResult]):
     console.print(table)
 
 
-def _perform_signing(image: str, status: str, config, timestamp: str, results: List[ScanResult]):
-    console.print(f"\n🔐 [bold]Signing container:[/bold] {image}")
+def _perform_signing(images: List[str], status: str, config, timestamp: str, results: List[ScanResult]):
+    console.print(f"\n🔐 [bold]Signing container:[/bold] {', '.join(images)}")
     key_path = config.private_key_path or os.environ.get("VERITENSOR_PRIVATE_KEY_PATH")
     if not key_path:
          console.print("[red]Skipping signing: No private key found.[/red]")
@@ -487,7 +570,7 @@ def _perform_signing(image: str, status: str, config, timestamp: str, results: L
         if primary.repo_id:
             annotations["ai.model.source"] = primary.repo_id
 
-    success = sign_container(image, key_path, annotations=annotations)
+    success = sign_containers(images, key_path, annotations=annotations)
     
     if success:
         console.print(f"[green]✔ Signed with Smart Attestation.[/green]")
@@ -1,12 +1,24 @@
 # Copyright 2026 Veritensor Security Apache 2.0
+import os
+import json
+import time
 import sqlite3
+import hashlib
 import logging
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Any, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
-CACHE_FILE = Path.home() / ".veritensor" / "cache.db"
+
+def get_cache_dir() -> Path:
+    """Root directory for on-disk caches. VERITENSOR_CACHE_DIR overrides ~/.veritensor."""
+    override = os.environ.get("VERITENSOR_CACHE_DIR")
+    return Path(override) if override else Path.home() / ".veritensor"
+
+
+CACHE_FILE = get_cache_dir() / "cache.db"
 
 class HashCache:
     def __init__(self):
@@ -91,3 +103,176 @@ class HashCache:
                 self.conn.close()
             except Exception:
                 pass
+
+
+class TextCache:
+    """
+    Content-addressed store for text extracted from binary documents (PDF, DOCX, PPTX).
+    Entries are keyed by the file's SHA256, so re-scans skip the slow parsers.
+    Writes are atomic (temp file + os.replace), so parallel workers can share it.
+    Least-recently-used entries are evicted once the store exceeds max_bytes.
+    """
+    DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self.root = root or get_cache_dir() / "text"
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("VERITENSOR_TEXT_CACHE_MAX_BYTES", self.DEFAULT_MAX_BYTES))
+        self.max_bytes = max_bytes
+
+    def _entry(self, key: str) -> Path:
+        return self.root / f"{key}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns cached text for the key, or None on a miss."""
+        entry = self._entry(key)
+        try:
+            text = entry.read_text(encoding="utf-8")
+            # Touch mtime: eviction drops the least recently used entries first
+            os.utime(entry)
+            return text
+        except OSError:
+            return None
+
+    def get_path(self, key: str) -> Optional[Path]:
+        """Returns the entry file for the key (for streamed reads), or None on a miss."""
+        entry = self._entry(key)
+        try:
+            os.utime(entry)
+            return entry
+        except OSError:
+            return None
+
+    def write_through(self, key: str, pieces: Iterable[str]) -> Iterator[str]:
+        """
+        Yields pieces unchanged while writing them, newline-joined, to the entry.
+        The entry is committed only if the iterator is exhausted and produced
+        some text: a consumer that stops early (threat found) leaves no partial entry.
+        """
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            f = os.fdopen(fd, "w", encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Text cache write error: {e}")
+            yield from pieces
+            return
+
+        committed = False
+        has_text = False
+        try:
+            separator = ""
+            for piece in pieces:
+                if f is not None:
+                    try:
+                        f.write(separator)
+                        f.write(piece)
+                    except OSError as e:
+                        logger.debug(f"Text cache write error: {e}")
+                        f.close()
+                        f = None
+                separator = "\n"
+                has_text = has_text or bool(piece)
+                yield piece
+
+            if f is not None and has_text:
+                try:
+                    f.close()
+                    os.replace(tmp_path, self._entry(key))
+                    committed = True
+                    self._evict()
+                except OSError as e:
+                    logger.debug(f"Text cache write error: {e}")
+        finally:
+            if f is not None:
+                f.close()
+            if not committed:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def set(self, key: str, text: str):
+        """Stores text for the key. Failures are logged and ignored."""
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(tmp_path, self._entry(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._evict()
+        except Exception as e:
+            logger.debug(f"Text cache write error: {e}")
+
+    def _evict(self):
+        entries = []
+        total = 0
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if entry.name.endswith(".txt"):
+                    stats = entry.stat()
+                    entries.append((stats.st_mtime, stats.st_size, entry.path))
+                    total += stats.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
+class ResponseCache:
+    """
+    On-disk cache for JSON API responses (Hugging Face Hub metadata).
+    Entries younger than ttl seconds are served without a request; older ones
+    are revalidated with If-None-Match, so unchanged repos cost a 304.
+    """
+    DEFAULT_TTL = 3600  # 1 hour
+
+    def __init__(self, root: Optional[Path] = None, ttl: Optional[int] = None):
+        self.root = root or get_cache_dir() / "hf"
+        if ttl is None:
+            ttl = int(os.environ.get("VERITENSOR_HF_CACHE_TTL", self.DEFAULT_TTL))
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, str]] = None, token: Optional[str] = None) -> str:
+        # The token is part of the key: private repos must not leak across credentials
+        raw = json.dumps([url, sorted((params or {}).items()), token or ""])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns {"etag", "stored_at", "body"} for the key, or None on a miss."""
+        try:
+            with open(self.root / f"{key}.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry.get("stored_at", 0) < self.ttl
+
+    def set(self, key: str, etag: Optional[str], body: Any):
+        """Stores a response body. Failures are logged and ignored."""
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"etag": etag, "stored_at": time.time(), "body": body}, f)
+                os.replace(tmp_path, self.root / f"{key}.json")
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.debug(f"Response cache write error: {e}")
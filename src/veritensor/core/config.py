@@ -8,6 +8,7 @@
 
 import os
 import logging
+import threading
 import yaml # Now a hard dependency
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -16,7 +17,9 @@ from typing import List, Optional, Set
 logger = logging.getLogger(__name__)
 DEFAULT_CONFIG_PATH = Path("veritensor.yaml")
 
-@dataclass
+# Frozen: the config is shared by every engine and pickled to each worker,
+# so nothing may mutate it after load. Slots keep the pickled payload small.
+@dataclass(frozen=True, slots=True)
 class VeritensorConfig:
     allowed_modules: List[str] = field(default_factory=list)
     ignored_rules: List[str] = field(default_factory=list)
@@ -33,12 +36,21 @@ class VeritensorConfig:
     
 class ConfigLoader:
     _instance: Optional[VeritensorConfig] = None
+    _lock = threading.Lock()
 
     @classmethod
     def load(cls, config_path: Path = DEFAULT_CONFIG_PATH) -> VeritensorConfig:
-        if cls._instance:
+        if cls._instance is not None:
             return cls._instance
 
+        # Double-checked: concurrent first calls parse the YAML only once
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls._build(config_path)
+        return cls._instance
+
+    @classmethod
+    def _build(cls, config_path: Path) -> VeritensorConfig:
         config_data = {}
         if config_path.exists():
             try:
@@ -68,7 +80,7 @@ class ConfigLoader:
         if "VERITENSOR_API_KEY" in os.environ:
             config_data["api_key"] = os.environ["VERITENSOR_API_KEY"]
             
-        cls._instance = VeritensorConfig(
+        return VeritensorConfig(
             allowed_modules=config_data.get("allowed_modules", []),
             ignored_rules=config_data.get("ignored_rules", []),
             fail_on_severity=config_data.get("fail_on_severity", "CRITICAL"),
@@ -81,7 +93,6 @@ class ConfigLoader:
             report_url=config_data.get("report_url"),
             api_key=config_data.get("api_key")
         )
-        return cls._instance
 
     @classmethod
     def get_safe_modules(cls) -> Set[str]:
@@ -2,10 +2,14 @@
 # Logic adapted from AIsbom (Apache 2.0 License)
 
 import io
+import os
+import mmap
+import threading
 import requests
 import logging
+from contextlib import contextmanager
 from urllib.parse import urlparse
-from typing import Optional, List, Any
+from typing import Optional, List, Any, BinaryIO, Iterator
 from veritensor.core.networking import validate_url_safety
 
 logger = logging.getLogger(__name__)
@@ -22,6 +26,9 @@ except ImportError:
 
 ALLOWED_DOMAINS = {"huggingface.co", "cdn-lfs.huggingface.co"}
 
+# Local files above this size are memory-mapped instead of read into the heap.
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
 class RemoteStream(io.IOBase):
     """
     A file-like object that reads data from a URL using HTTP Range headers.
@@ -182,6 +189,102 @@ class S3Stream(io.IOBase):
     def __enter__(self): return self
     def __exit__(self, exc_type, exc, tb): self.close()
 
+# Whole-file readahead is requested only up to this size, so huge shards
+# do not evict the page cache; larger files still get sequential readahead.
+PREFETCH_MAX_BYTES = 256 * 1024 * 1024
+
+def advise_sequential(fh: BinaryIO):
+    """
+    Tells the kernel the file will be read front to back (Linux/BSD only).
+    WILLNEED starts asynchronous readahead, so disk I/O overlaps with the
+    hashing/scanning work done on the already-read part of the file.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = fh.fileno()
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        size = os.fstat(fd).st_size
+        if size <= PREFETCH_MAX_BYTES:
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+    except (OSError, ValueError):
+        pass
+
+# Batch scans below this many files finish before readahead could pay off.
+PREFETCH_MIN_FILES = 32
+
+def prefetch_file(path: str):
+    """Starts asynchronous readahead for a whole file without reading it."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        size = os.fstat(fd).st_size
+        if size <= PREFETCH_MAX_BYTES:
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class Readahead:
+    """
+    Pulls upcoming files of a batch scan into the page cache from a background
+    thread, so the kernel reads file N+1.. while workers scan file N.
+    At most `window` files are kept ahead of the results consumed via advance(),
+    which stops a large batch from evicting its own prefetched pages.
+    """
+    def __init__(self, paths: List[str], window: int):
+        self._paths = paths
+        self._slots = threading.Semaphore(window)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="veritensor-readahead", daemon=True)
+
+    def start(self) -> "Readahead":
+        if hasattr(os, "posix_fadvise"):
+            self._thread.start()
+        return self
+
+    def _run(self):
+        for path in self._paths:
+            self._slots.acquire()
+            if self._stop.is_set():
+                return
+            prefetch_file(path)
+
+    def advance(self):
+        """Marks one file as scanned, letting the thread prefetch one more."""
+        self._slots.release()
+
+    def close(self):
+        self._stop.set()
+        self._slots.release()
+
+class MappedFile(mmap.mmap):
+    """Read-only mmap usable as a seekable stream (mmap.seekable() is 3.13+ only)."""
+    def seekable(self) -> bool: return True
+
+@contextmanager
+def in_memory_stream(fh: BinaryIO) -> Iterator[BinaryIO]:
+    """
+    Yields the rest of a local file as an in-memory stream.
+    Opcode-level parsers (pickletools.genops) issue millions of tiny reads,
+    which are ~30% cheaper against BytesIO/mmap than through BufferedReader.
+    Small files are read in one call; large ones are mapped from the page cache.
+    """
+    size = os.fstat(fh.fileno()).st_size - fh.tell()
+    if size < MMAP_THRESHOLD:
+        yield io.BytesIO(fh.read())
+        return
+
+    mapped = MappedFile(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        mapped.seek(fh.tell())
+        yield mapped
+    finally:
+        mapped.close()
+
 def get_stream_for_path(path: str):
     """Factory to get correct stream (S3 or HTTP)."""
     if path.startswith("s3://"):
@@ -1,5 +1,5 @@
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Dict, Any
 from enum import Enum
 
 class Severity(str, Enum):
@@ -8,7 +8,9 @@ class Severity(str, Enum):
     MEDIUM = "MEDIUM"
     LOW = "LOW"
 
-@dataclass
+# slots: one result is kept per scanned file, so large scans hold tens of
+# thousands of these without a per-instance __dict__.
+@dataclass(slots=True)
 class ScanResult:
     file_path: str
     status: str = "PASS"  # PASS / FAIL
@@ -19,7 +21,14 @@ class ScanResult:
     identity_verified: bool = False
     detected_license: Optional[str] = None
     repo_id: Optional[str] = None
+    file_format: Optional[str] = None
     
     def add_threat(self, message: str):
         self.threats.append(message)
         self.status = "FAIL"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field dict for JSON output (replaces __dict__, absent with slots)."""
+        return {name: getattr(self, name) for name in _RESULT_FIELDS}
+
+_RESULT_FIELDS = tuple(f.name for f in fields(ScanResult))
@@ -2,45 +2,78 @@
 # RAG Scanner: Detects Prompt Injections, PII, and Stealth Attacks (CSS/HTML hiding).
 
 import logging
+import mmap
 import re 
-from typing import List, Generator, Set
+from typing import List, Generator, Set, Callable, Optional, Iterable
 from pathlib import Path
-from veritensor.engines.static.rules import SignatureLoader
-from veritensor.engines.content.pii import PIIScanner
+from veritensor.core.cache import TextCache
+from veritensor.engines.hashing.calculator import calculate_sha256
+from veritensor.engines.static.rules import SignatureLoader, get_matcher
+from veritensor.engines.content.pii import PIIScanner, MAX_PII_SCAN_SIZE
 
 logger = logging.getLogger(__name__)
 
 # Supported text formats for RAG scanning
-TEXT_EXTENSIONS = {
-    # Documentation & Markup
+# Documentation & Markup
+MARKUP_EXTENSIONS = {
     ".txt", ".md", ".markdown", ".rst", ".adoc", ".asciidoc", 
     ".tex", ".org", ".wiki", ".html", ".htm", ".css",
-    
-    # Data & Configs
+}
+
+# Data & Configs
+CONFIG_EXTENSIONS = {
     ".json", ".xml", ".yaml", ".yml", ".toml", 
     ".ini", ".cfg", ".conf", ".env", ".properties", ".editorconfig",
-    
-    # Source Code
+}
+
+# Source Code
+SOURCE_EXTENSIONS = {
     ".py", ".js", ".ts", ".java", ".c", ".cpp", ".h", ".hpp",
     ".rs", ".go", ".rb", ".php", ".pl", ".lua",
     ".sh", ".bash", ".zsh", ".ps1", ".bat", ".sql",
-    
-    # Infrastructure
+}
+
+# Infrastructure
+INFRA_EXTENSIONS = {
     ".dockerfile", ".tf", ".tfvars", ".k8s", ".helm", ".tpl",
     ".gitignore", ".gitattributes",
-    
-    # Logs
+}
+
+# Logs
+LOG_EXTENSIONS = {
     ".log", ".out", ".err"
 }
 
+TEXT_EXTENSIONS = MARKUP_EXTENSIONS | CONFIG_EXTENSIONS | SOURCE_EXTENSIONS | INFRA_EXTENSIONS | LOG_EXTENSIONS
+
+# Machine-oriented files: NER hits (names, places) there are noise, so Presidio
+# only runs when a structured PII marker is present (see PIIScanner.has_candidates).
+PII_PREFILTER_EXTENSIONS = CONFIG_EXTENSIONS | SOURCE_EXTENSIONS | INFRA_EXTENSIONS
+
 DOC_EXTS = {".pdf", ".docx", ".pptx"}
 
 # Import Optional Dependencies
 try:
     import pypdf
-    PDF_AVAILABLE = True
+    PYPDF_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
+    PYPDF_AVAILABLE = False
+
+# Native PDFium bindings: same text, several times faster than pure-Python pypdf
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+# MuPDF is used when the user installed it; it is AGPL, so it is not part of any extra
+try:
+    import pymupdf
+    MUPDF_AVAILABLE = True
+except ImportError:
+    MUPDF_AVAILABLE = False
+
+PDF_AVAILABLE = PYPDF_AVAILABLE or PDFIUM_AVAILABLE or MUPDF_AVAILABLE
 
 try:
     import docx
@@ -55,6 +88,7 @@ except ImportError:
     PPTX_AVAILABLE = False
 
 CHUNK_SIZE = 1024 * 1024 # 1MB chunks
+MAX_PDF_PAGES = 50       # Pages extracted per PDF
 OVERLAP_SIZE = 4096      # 4KB overlap
 
 # --- STEALTH ATTACK SIGNATURES (CSS/HTML Hiding) ---
@@ -74,14 +108,18 @@ STEALTH_PATTERNS = [
     r"<span[^>]*style=.*?>.*?</span>" 
 ]
 
-def scan_document(file_path: Path) -> List[str]:
+# Compiled for raw bytes: matched against the mmap directly, with no decode
+_STEALTH_REGEXES = [re.compile(p.encode("latin-1"), re.IGNORECASE) for p in STEALTH_PATTERNS]
+
+def scan_document(file_path: Path, file_hash: Optional[str] = None) -> List[str]:
     """
     Universal entry point for scanning documents (RAG Data).
+    file_hash (SHA256, if the caller already computed it) keys the extracted-text cache.
     """
     ext = file_path.suffix.lower()
     threats = []
     
-    signatures = SignatureLoader.get_prompt_injections()
+    signatures = get_matcher(tuple(SignatureLoader.get_prompt_injections()))
 
     try:
         # --- PHASE 1: Raw Content Scan (Stealth Detection) ---
@@ -95,14 +133,11 @@ def scan_document(file_path: Path) -> List[str]:
         if ext in TEXT_EXTENSIONS:
             text_generator = _read_text_sliding(file_path)
         elif ext == ".pdf" and PDF_AVAILABLE:
-            full_text = _read_pdf(file_path)
-            text_generator = _yield_string_chunks(full_text)
+            text_generator = _cached_extract(file_path, _iter_pdf_pages, file_hash)
         elif ext == ".docx" and DOCX_AVAILABLE:
-            full_text = _read_docx(file_path)
-            text_generator = _yield_string_chunks(full_text)
+            text_generator = _cached_extract(file_path, _iter_docx_paragraphs, file_hash)
         elif ext == ".pptx" and PPTX_AVAILABLE:
-            full_text = _extract_text_from_pptx(file_path)
-            text_generator = _yield_string_chunks(full_text)
+            text_generator = _cached_extract(file_path, _iter_pptx_text, file_hash)
         else:
             return threats 
 
@@ -125,30 +160,19 @@ def scan_document(file_path: Path) -> List[str]:
                         threats.append(f"HIGH: Obfuscated/Spaced Injection detected in {file_path.name}: '{kw}'")
                         return threats
 
-            # Check Standard Signatures
-            for pattern in signatures:
-                is_hit = False
-                found_text = ""
-                
-                if pattern.startswith("regex:"):
-                    regex_str = pattern.replace("regex:", "", 1).strip()
-                    try:
-                        match = re.search(regex_str, clean_chunk, re.IGNORECASE)
-                        if match:
-                            is_hit = True
-                            found_text = match.group(0)[:100]
-                    except re.error:
-                        logger.warning(f"Invalid regex in signatures: {regex_str}")
-                else:
-                    if pattern.lower() in clean_chunk.lower():
-                        is_hit = True
-                        found_text = pattern 
-                
-                if is_hit:
-                    threats.append(f"HIGH: Prompt Injection detected in {file_path.name}: Found '{found_text}'")
-                    return threats 
+            # Check Standard Signatures (single pass over all patterns)
+            hit = signatures.search(clean_chunk)
+            if hit:
+                pattern, found_text = hit
+                if not (pattern.startswith("regex:") or pattern.startswith("pattern:")):
+                    found_text = pattern
+                threats.append(f"HIGH: Prompt Injection detected in {file_path.name}: Found '{found_text[:100]}'")
+                return threats
 
             # B. PII Scan
+            # Only the part of the chunk that scan() analyzes needs a marker
+            if ext in PII_PREFILTER_EXTENSIONS and not PIIScanner.has_candidates(chunk[:MAX_PII_SCAN_SIZE]):
+                continue
             pii_threats = PIIScanner.scan(chunk)
             if pii_threats:
                 threats.extend(pii_threats)
@@ -165,34 +189,30 @@ def scan_document(file_path: Path) -> List[str]:
 def _scan_raw_binary(path: Path) -> List[str]:
     """
     Scans the raw bytes of a file for CSS/HTML hiding techniques.
+    The file is memory-mapped and searched in CHUNK_SIZE windows (pos/endpos),
+    so no chunk is copied or decoded; windows overlap by OVERLAP_SIZE.
     """
     threats = []
     try:
-        with open(path, "rb") as f:
-            buffer = ""
-            while True:
-                chunk_bytes = f.read(CHUNK_SIZE)
-                if not chunk_bytes:
-                    break
-                
-                # Decode as Latin-1 to preserve all byte values
-                chunk_str = chunk_bytes.decode("latin-1")
-                data = buffer + chunk_str
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            size = len(data)
+            for start in range(0, size, CHUNK_SIZE):
+                window_start = max(0, start - OVERLAP_SIZE)
+                window_end = min(size, start + CHUNK_SIZE)
                 
                 # Check Stealth Patterns
-                for pattern in STEALTH_PATTERNS:
-                    # FIX: Capture the match object to report the ACTUAL found text
-                    match = re.search(pattern, data, re.IGNORECASE)
+                for pattern in _STEALTH_REGEXES:
+                    # Capture the match object to report the ACTUAL found text
+                    match = pattern.search(data, window_start, window_end)
                     if match:
-                        found_text = match.group(0)
+                        found_text = match.group(0).decode("latin-1")
                         # Truncate for log readability
                         if len(found_text) > 50: found_text = found_text[:47] + "..."
                         
                         threats.append(f"MEDIUM: Stealth/Hiding technique detected in {path.name} (Raw): '{found_text}'")
                         return threats 
-                
-                buffer = chunk_str[-OVERLAP_SIZE:]
     except Exception:
+        # Includes ValueError from mmap on empty files
         pass 
     return threats
 
@@ -207,46 +227,161 @@ def _read_text_sliding(path: Path) -> Generator[str, None, None]:
             yield data
             buffer = chunk[-OVERLAP_SIZE:]
 
-def _yield_string_chunks(text: str) -> Generator[str, None, None]:
-    if not text: return
-    yield text
+def _cached_extract(
+    path: Path, extractor: Callable[[Path], Iterable[str]], file_hash: Optional[str] = None
+) -> Generator[str, None, None]:
+    """
+    Streams a document's extracted text in CHUNK_SIZE windows, through the
+    on-disk TextCache (keyed by SHA256). Parsing PDF/DOCX/PPTX takes seconds
+    for large files; CI re-runs read the cached text instead.
+    Only one window (roughly one page batch) is held in memory at a time.
+    """
+    try:
+        key = f"{file_hash or calculate_sha256(path)}-{path.suffix.lower().lstrip('.')}"
+    except OSError:
+        yield from _batch_pieces(extractor(path))
+        return
+
+    cache = TextCache()
+    cached = cache.get_path(key)
+    if cached is not None:
+        yield from _read_text_sliding(cached)
+    else:
+        # Committed only if the extractor runs to completion with some text
+        yield from _batch_pieces(cache.write_through(key, extractor(path)))
+
+def _batch_pieces(pieces: Iterable[str]) -> Generator[str, None, None]:
+    """
+    Joins pages/paragraphs with newlines into ~CHUNK_SIZE windows.
+    Consecutive windows overlap by OVERLAP_SIZE, like _read_text_sliding,
+    so signatures spanning a page boundary are still seen whole.
+    """
+    parts: List[str] = []
+    size = 0
+    pending = False
+    for piece in pieces:
+        parts.append(piece)
+        size += len(piece) + 1
+        pending = True
+        if size >= CHUNK_SIZE:
+            window = "\n".join(parts)
+            if window.strip():
+                yield window
+            tail = window[-OVERLAP_SIZE:]
+            parts, size, pending = [tail], len(tail), False
+
+    if pending:
+        window = "\n".join(parts)
+        if window.strip():
+            yield window
+
+def _iter_pdf_pages(path: Path) -> Generator[str, None, None]:
+    if PDFIUM_AVAILABLE:
+        try:
+            pdf = pdfium.PdfDocument(str(path))
+        except Exception as e:
+            logger.debug(f"PDFium parsing error, falling back to pypdf: {e}")
+        else:
+            yield from _iter_pdfium_pages(pdf)
+            return
+    if MUPDF_AVAILABLE:
+        try:
+            doc = pymupdf.open(str(path), filetype="pdf")
+        except Exception as e:
+            logger.debug(f"MuPDF parsing error, falling back to pypdf: {e}")
+        else:
+            yield from _iter_mupdf_pages(doc)
+            return
+    if not PYPDF_AVAILABLE:
+        return
 
-def _read_pdf(path: Path) -> str:
-    text_content = []
     try:
         reader = pypdf.PdfReader(path)
-        max_pages = min(len(reader.pages), 50) 
+        max_pages = min(len(reader.pages), MAX_PDF_PAGES) 
         for i in range(max_pages):
-            page_text = reader.pages[i].extract_text()
+            page = reader.pages[i]
+            if not _pdf_page_may_have_text(page):
+                continue
+            page_text = page.extract_text()
             if page_text:
-                text_content.append(page_text)
-        return "\n".join(text_content)
+                yield page_text
     except Exception as e:
         logger.debug(f"PDF parsing error: {e}")
-        return ""
 
-def _read_docx(path: Path) -> str:
-    text_content = []
+# Operators that open a text object or show text; a page without any of them
+# (typically a scanned image) cannot produce text.
+_PDF_TEXT_OPERATORS = (b"BT", b"Tj", b"TJ")
+
+def _pdf_page_may_have_text(page) -> bool:
+    """
+    Cheap pre-check before pypdf's pure-Python extract_text(), which tokenizes
+    the whole content stream even for scanned pages with no text at all.
+    Form XObjects carry their own content streams, so pages drawing them are
+    always extracted. Any doubt errs on the side of extracting.
+    """
+    try:
+        contents = page.get_contents()
+        if contents is None:
+            return False
+        data = contents.get_data()
+        if any(op in data for op in _PDF_TEXT_OPERATORS):
+            return True
+
+        resources = page.get("/Resources")
+        xobjects = resources.get_object().get("/XObject") if resources else None
+        if xobjects:
+            for xobject in xobjects.get_object().values():
+                if xobject.get_object().get("/Subtype") == "/Form":
+                    return True
+        return False
+    except Exception:
+        return True
+
+def _iter_pdfium_pages(pdf) -> Generator[str, None, None]:
+    try:
+        for i in range(min(len(pdf), MAX_PDF_PAGES)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                page_text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            if page_text:
+                yield page_text
+    except Exception as e:
+        logger.debug(f"PDFium page extraction error: {e}")
+    finally:
+        pdf.close()
+
+def _iter_mupdf_pages(doc) -> Generator[str, None, None]:
+    try:
+        for page in doc.pages(0, min(doc.page_count, MAX_PDF_PAGES)):
+            page_text = page.get_text("text")
+            if page_text:
+                yield page_text
+    except Exception as e:
+        logger.debug(f"MuPDF page extraction error: {e}")
+    finally:
+        doc.close()
+
+def _iter_docx_paragraphs(path: Path) -> Generator[str, None, None]:
     try:
         doc = docx.Document(path)
         max_paras = min(len(doc.paragraphs), 2000)
         for i in range(max_paras):
-            text_content.append(doc.paragraphs[i].text)
-        return "\n".join(text_content)
+            yield doc.paragraphs[i].text
     except Exception as e:
         logger.debug(f"DOCX parsing error: {e}")
-        return ""
 
-def _extract_text_from_pptx(path: Path) -> str:
+def _iter_pptx_text(path: Path) -> Generator[str, None, None]:
     if not PPTX_AVAILABLE:
-        return ""
-    text_runs = []
+        return
     try:
         prs = Presentation(path)
         for slide in prs.slides:
             for shape in slide.shapes:
                 if hasattr(shape, "text"):
-                    text_runs.append(shape.text)
+                    yield shape.text
     except Exception as e:
         logger.warning(f"Failed to parse PPTX {path.name}: {e}")
-    return "\n".join(text_runs)
@@ -1,6 +1,7 @@
 # Copyright 2026 Veritensor Security
 # PII Scanner wrapper around Microsoft Presidio (NLP-based)
 
+import re
 import logging
 from typing import List
 
@@ -12,6 +13,18 @@ try:
 except ImportError:
     PRESIDIO_AVAILABLE = False
 
+# Structured PII (emails, phone/SSN/card/IBAN numbers, IPs) always carries one of
+# these markers. The email marker needs text around the '@' so that Python
+# decorators do not count. Checking for them is a single C-level regex pass, far cheaper
+# than running the NLP pipeline over text that cannot contain such entities.
+PII_HINT_PATTERN = re.compile(
+    r"\S@\S+\.\w|\d(?:[-.\s]?\d){6,}|\b\d{1,3}(?:\.\d{1,3}){3}\b|\bssn\b|api[_-]?key",
+    re.IGNORECASE
+)
+
+# Characters passed to the NLP pipeline per scan() call
+MAX_PII_SCAN_SIZE = 100_000
+
 class PIIScanner:
     _engine = None
     _init_error = None
@@ -44,6 +57,14 @@ class PIIScanner:
         
         return cls._engine
 
+    @staticmethod
+    def has_candidates(text: str) -> bool:
+        """
+        Fast prefilter: False means the text holds no structured PII markers.
+        NER-only entities (names, locations) are not covered by this check.
+        """
+        return PII_HINT_PATTERN.search(text) is not None
+
     @staticmethod
     def scan(text: str) -> List[str]:
         """
@@ -59,7 +80,7 @@ class PIIScanner:
         threats = []
         try:
             # Limit text length to avoid hanging on massive logs (100KB limit)
-            text_sample = text[:100000] 
+            text_sample = text[:MAX_PII_SCAN_SIZE]
             results = engine.analyze(text=text_sample, language='en')
             
             for res in results:
@@ -6,9 +6,9 @@ import json
 import csv
 import sys
 from pathlib import Path
-from typing import List, Generator, Optional, Any
+from typing import List, Generator, Optional, Any, Iterator, Iterable, Tuple, Union
 
-from veritensor.engines.static.rules import SignatureLoader, is_match
+from veritensor.engines.static.rules import SignatureLoader, get_matcher
 from veritensor.engines.content.pii import PIIScanner
 
 logger = logging.getLogger(__name__)
@@ -16,15 +16,29 @@ logger = logging.getLogger(__name__)
 # Optional Imports (Lazy Loading)
 try:
     import pyarrow.parquet as pq
+    import pyarrow.csv as pacsv
+    import pyarrow.compute as pc
     import pyarrow as pa
     PYARROW_AVAILABLE = True
 except ImportError:
     PYARROW_AVAILABLE = False
 
+# Faster JSONL parsing (pip install veritensor[fast])
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Config
 MAX_ROWS_DEFAULT = 10_000  # Quick scan limit (Sampling)
 CHUNK_SIZE = 1000          # Rows per batch
 MAX_JSON_LINE_SIZE = 10 * 1024 * 1024 # 10MB limit for JSONL lines (DoS protection)
+JSONL_READ_SIZE = 8 * 1024 * 1024 # Bytes per JSONL read() call
+CSV_BLOCK_SIZE = 8 * 1024 * 1024 # Bytes per Arrow CSV block
+MAX_BACKTRACKING_SCAN = 4096 # Per-row scan limit when falling back to stdlib re
+SCREEN_BATCH_CHARS = 8 * 1024 * 1024 # Characters per vectorized screening batch
+MAX_SEEN_ROWS = 100_000    # Distinct row hashes remembered per file for deduplication
 
 # FALLBACK PATTERNS 
 FALLBACK_SUSPICIOUS = [
@@ -55,6 +69,10 @@ def scan_dataset(file_path: Path, full_scan: bool = False) -> List[str]:
     if not suspicious: 
         suspicious = FALLBACK_SUSPICIOUS
 
+    injection_matcher = get_matcher(tuple(injections))
+    suspicious_matcher = get_matcher(tuple(suspicious))
+    linear_time = injection_matcher.linear_time and suspicious_matcher.linear_time
+
     # 2. Setup Limit
     row_limit = None if full_scan else MAX_ROWS_DEFAULT
     
@@ -79,28 +97,39 @@ def scan_dataset(file_path: Path, full_scan: bool = False) -> List[str]:
         # 4. Scan Loop
         row_count = 0
         pii_buffer = [] 
+        literals = injection_matcher.literals + suspicious_matcher.literals
+        seen = set()
         
-        for text_chunk in text_stream:
+        for text_chunk, screened in _screen_rows(text_stream, literals):
             if not text_chunk: continue
             
-            # ReDoS protection
-            scan_text = text_chunk if len(text_chunk) <= 4096 else text_chunk[:4096]
+            # ReDoS protection (unnecessary when every rule runs on RE2)
+            if len(text_chunk) <= MAX_BACKTRACKING_SCAN or linear_time:
+                scan_text = text_chunk
+            else:
+                scan_text = text_chunk[:MAX_BACKTRACKING_SCAN]
+
+            # Enum-like columns and boilerplate repeat the same row text many
+            # times; identical text cannot produce new findings
+            key = hash(scan_text)
+            if key not in seen:
+                if len(seen) < MAX_SEEN_ROWS:
+                    seen.add(key)
 
-            # A. Prompt Injection (Fail Fast)
-            for pat in injections:
-                if is_match(scan_text, [pat]):
-                    threats.append(f"HIGH: Data Poisoning (Injection) detected in {file_path.name}: '{pat}'")
+                # A. Prompt Injection (Fail Fast)
+                hit = injection_matcher.search(scan_text, screened)
+                if hit:
+                    threats.append(f"HIGH: Data Poisoning (Injection) detected in {file_path.name}: '{hit[0]}'")
                     return threats 
 
-            # B. Malicious URLs / Secrets (Regex)
-            for pat in suspicious:
-                if is_match(scan_text, [pat]):
+                # B. Malicious URLs / Secrets (Regex)
+                for pat, _ in suspicious_matcher.findall(scan_text, screened):
                     label = "Malicious URL" if "http" in pat or "://" in pat else "Secret/PII"
                     threats.append(f"MEDIUM: {label} detected in dataset {file_path.name}: '{pat}'")
-            
-            # C. Collect PII Sample 
-            if len(pii_buffer) < 50:
-                pii_buffer.append(scan_text)
+                
+                # C. Collect PII Sample 
+                if len(pii_buffer) < 50:
+                    pii_buffer.append(scan_text)
 
             row_count += 1
             # Check limit here (Centralized control)
@@ -119,6 +148,58 @@ def scan_dataset(file_path: Path, full_scan: bool = False) -> List[str]:
 
     return threats
 
+def _screen_rows(text_stream: Iterator[str], literals: Iterable[str]) -> Generator[Tuple[str, bool], None, None]:
+    """
+    Pairs each row with a 'screened' flag for SignatureMatcher.search/findall.
+    Rows are screened a batch at a time by one vectorized Arrow (RE2) pass: a row
+    is screened when it is ASCII and contains none of the rules' required
+    literals, so only the rules without a literal need to run on it. Batches are
+    capped at SCREEN_BATCH_CHARS; larger rows are passed through unscreened.
+    """
+    literals = list(dict.fromkeys(literals))
+    if not PYARROW_AVAILABLE or not literals:
+        for text in text_stream:
+            yield text, False
+        return
+
+    # Hex escapes are valid RE2 for any byte, unlike re.escape() of whitespace
+    pattern = "|".join(
+        "".join(c if c.isalnum() else f"\\x{ord(c):02x}" for c in literal) for literal in literals
+    )
+    # Rows may be up to MAX_JSON_LINE_SIZE and a batch is held twice (list + Arrow
+    # copy), so bound it by characters too; this also bounds read-ahead on fail-fast
+    rows, size = [], 0
+    for text in text_stream:
+        if len(text) > SCREEN_BATCH_CHARS:
+            # Too large to be worth copying into Arrow: per-row path
+            yield from _screen_batch(rows, pattern)
+            rows, size = [], 0
+            yield text, False
+            continue
+
+        rows.append(text)
+        size += len(text)
+        if len(rows) >= CHUNK_SIZE or size >= SCREEN_BATCH_CHARS:
+            yield from _screen_batch(rows, pattern)
+            rows, size = [], 0
+
+    yield from _screen_batch(rows, pattern)
+
+def _screen_batch(rows: List[str], pattern: str) -> Generator[Tuple[str, bool], None, None]:
+    if not rows:
+        return
+    try:
+        batch = pa.array(rows, pa.large_string())
+        may_match = pc.or_(
+            pc.invert(pc.string_is_ascii(batch)),
+            pc.match_substring_regex(batch, pattern, ignore_case=True),
+        )
+        flags = pc.invert(may_match).to_pylist()
+    except pa.ArrowException as e:
+        logger.debug(f"Vectorized row screening failed, scanning rows in full: {e}")
+        flags = [False] * len(rows)
+    yield from zip(rows, flags)
+
 # --- GENERATORS (Infinite streams, limit handled by caller) ---
 
 def _stream_parquet(path: Path) -> Generator[str, None, None]:
@@ -136,15 +217,33 @@ def _stream_parquet(path: Path) -> Generator[str, None, None]:
         return
 
     for batch in parquet_file.iter_batches(batch_size=CHUNK_SIZE, columns=str_columns):
-        df = batch.to_pandas()
-        for _, row in df.iterrows():
-            # Convert row to single string
-            text_values = " ".join(row.dropna().astype(str).tolist())
-            yield text_values
+        yield from _join_rows([column.to_pylist() for column in batch.columns])
+
+def _join_rows(columns: List[List[Optional[str]]]) -> Generator[str, None, None]:
+    """
+    Joins column-wise values into one string per row (nulls skipped).
+    Columns are converted in C++ (to_pylist / Arrow batches) first, which
+    avoids building a pandas Series per row (iterrows, ~500x slower).
+    """
+    for row in zip(*columns):
+        yield " ".join([value for value in row if value is not None])
 
 def _stream_csv(path: Path) -> Generator[str, None, None]:
     ext = path.suffix.lower()
     sep = "\t" if ext == ".tsv" else ","
+
+    if PYARROW_AVAILABLE:
+        reader = _open_arrow_csv(path, sep)
+        if reader is not None:
+            with reader:
+                for batch in reader:
+                    # Same column selection as pandas' select_dtypes('object')
+                    text_columns = [c.to_pylist() for c in batch.columns if _is_text_column(c)]
+                    if text_columns:
+                        yield from _join_rows(text_columns)
+                    else:
+                        yield from ("" for _ in range(batch.num_rows))
+            return
     
     try:
         import pandas as pd
@@ -169,25 +268,106 @@ def _stream_csv(path: Path) -> Generator[str, None, None]:
             for row in reader:
                 yield " ".join(row)
                 
+def _open_arrow_csv(path: Path, sep: str):
+    """
+    Opens a streaming Arrow CSV reader (C++ parser, multi-threaded).
+    Every column is read as string: per-block type inference would abort the
+    stream when a later block disagrees. Returns None if Arrow cannot open it.
+    """
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+            header = next(csv.reader(f, delimiter=sep), None)
+        if not header:
+            return None
+        return pacsv.open_csv(
+            path,
+            read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            parse_options=pacsv.ParseOptions(delimiter=sep, invalid_row_handler=lambda row: "skip"),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=True,
+            ),
+        )
+    except (pa.ArrowException, OSError, csv.Error) as e:
+        logger.debug(f"Arrow CSV reader unavailable for {path.name}, using fallback: {e}")
+        return None
+
+def _is_text_column(column) -> bool:
+    """True unless every value parses as a number or boolean (pandas would not infer 'object')."""
+    for numeric_type in (pa.float64(), pa.bool_()):
+        try:
+            pc.cast(column, numeric_type)
+            return False
+        except pa.ArrowInvalid:
+            continue
+    return True
+
 def _stream_jsonl(path: Path) -> Generator[str, None, None]:
     """Reads JSONL safely."""
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+    for line in _iter_jsonl_lines(path):
+        data = _parse_json_line(line)
+        if data is None:
+            continue
+        strings = list(_extract_strings_from_json(data))
+        if strings:
+            yield " ".join(strings)
+
+def _iter_jsonl_lines(path: Path) -> Generator[bytes, None, None]:
+    """
+    Yields raw JSONL lines without text decoding (orjson parses UTF-8 bytes
+    directly), reading the file in 8 MiB blocks. Splits like text-mode
+    universal newlines (\n, \r\n, \r). Lines over MAX_JSON_LINE_SIZE are
+    skipped without ever being held in memory in full.
+    """
+    pending = b""     # Incomplete last line, continued by the next block
+    skipping = False  # Inside a line over MAX_JSON_LINE_SIZE
+    with open(path, "rb") as f:
         while True:
-            line = f.readline()
-            if not line:
+            block = f.read(JSONL_READ_SIZE)
+            if not block:
                 break
-                
-            # OOM Protection: Skip huge lines, do NOT yield, do NOT increment caller's count
-            if len(line) > MAX_JSON_LINE_SIZE:
-                continue
-
-            try:
-                data = json.loads(line)
-                strings = list(_extract_strings_from_json(data))
-                if strings:
-                    yield " ".join(strings)
-            except json.JSONDecodeError:
-                pass 
+
+            lines = (pending + block).splitlines(keepends=True)
+            # A trailing \r stays pending too: it may be the first half of \r\n
+            pending = lines.pop()
+            if pending.endswith(b"\n"):
+                lines.append(pending)
+                pending = b""
+
+            for line in lines:
+                if skipping:
+                    # Tail of the oversized line
+                    skipping = False
+                    continue
+                # OOM Protection: Skip huge lines, do NOT yield, do NOT increment caller's count
+                if len(line) <= MAX_JSON_LINE_SIZE:
+                    yield line
+
+            if len(pending) > MAX_JSON_LINE_SIZE:
+                skipping = True
+                pending = b"\r" if pending.endswith(b"\r") else b""
+
+        if pending and not skipping:
+            yield pending
+
+def _parse_json_line(line: Union[str, bytes]) -> Any:
+    """
+    Parses one JSONL record, or returns None if it is not valid JSON.
+    orjson is tried first; stdlib json covers what orjson rejects (NaN literals,
+    >1024 nesting levels, invalid UTF-8, which is dropped as text-mode reading
+    with errors="ignore" did). RecursionError means hostile nesting.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", errors="ignore")
+    try:
+        return json.loads(line)
+    except (ValueError, RecursionError):
+        return None
 
 def _extract_strings_from_json(data: Any) -> Generator[str, None, None]:
     stack = [data]
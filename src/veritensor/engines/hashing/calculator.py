@@ -73,13 +73,26 @@ def _compute_sha256_from_stream(fileobj: BinaryIO, chunk_size: int) -> str:
         pass
 
     # 2. Standard SHA256 calculation
-    sha = hashlib.sha256()
-    
-    while True:
-        chunk = fileobj.read(chunk_size)
-        if not chunk:
-            break
-        sha.update(chunk)
+    if hasattr(fileobj, "readinto"):
+        # Reuse one buffer instead of allocating a new bytes object per chunk.
+        # Not hashlib.file_digest: it ignores chunk_size and hashes getbuffer()
+        # objects (BytesIO) from offset 0 instead of the current position.
+        sha = hashlib.sha256()
+        buf = bytearray(chunk_size)
+        view = memoryview(buf)
+        while True:
+            size = fileobj.readinto(buf)
+            if not size:
+                break
+            sha.update(view[:size])
+    else:
+        # Generic streams (e.g. remote readers) only implement read()
+        sha = hashlib.sha256()
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                break
+            sha.update(chunk)
     
     # Try to reset cursor to start, so the file can be read again if needed by other engines
     try:
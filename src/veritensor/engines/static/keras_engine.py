@@ -8,8 +8,9 @@
 import json
 import zipfile
 import logging
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union, Optional, BinaryIO
 from veritensor.core.safe_zip import SafeZipReader, ZipBombError
 
 logger = logging.getLogger(__name__)
@@ -23,12 +24,39 @@ try:
 except ImportError:
     H5PY_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parses JSON with orjson (several times faster on multi-MB configs) when installed.
+    Falls back to stdlib json, which also accepts what orjson rejects (e.g. NaN).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except (orjson.JSONDecodeError, TypeError):
+            pass
+    return json.loads(data)
+
+HDF5_MAGIC = b'\x89HDF\r\n\x1a\n'
+
 def scan_keras_file(file_path: Path) -> List[str]:
     threats = []
     try:
-        if zipfile.is_zipfile(file_path):
-            threats.extend(_scan_keras_zip(file_path))
-        elif _is_hdf5(file_path):
+        # One open() serves both format probes and the zip scan itself.
+        with open(file_path, "rb") as f:
+            is_hdf5 = f.read(8) == HDF5_MAGIC
+            # is_zipfile() locates the central directory itself, so archives with
+            # prepended data (HDF5/zip polyglots) are still caught.
+            if zipfile.is_zipfile(f):
+                f.seek(0)
+                threats.extend(_scan_keras_zip(file_path, f))
+
+        if is_hdf5:
             if H5PY_AVAILABLE:
                 threats.extend(_scan_keras_h5(file_path))
             else:
@@ -37,24 +65,17 @@ def scan_keras_file(file_path: Path) -> List[str]:
         threats.append(f"Scan Error: {str(e)}")
     return threats
 
-def _is_hdf5(file_path: Path) -> bool:
-    try:
-        with open(file_path, "rb") as f:
-            return f.read(8) == b'\x89HDF\r\n\x1a\n'
-    except Exception:
-        return False
-
 def _safe_read_json(file_obj) -> Dict[str, Any]:
     """Reads JSON with a hard size limit to prevent DoS."""
     data = file_obj.read(MAX_CONFIG_SIZE)
     if len(file_obj.read(1)) > 0: # Try reading one more byte
         raise ValueError("Config file too large (Zip Bomb protection)")
-    return json.loads(data)
+    return _json_loads(data)
 
-def _scan_keras_zip(file_path: Path) -> List[str]:
+def _scan_keras_zip(file_path: Path, fileobj: Optional[BinaryIO] = None) -> List[str]:
     threats = []
     try:
-        with zipfile.ZipFile(file_path, "r") as z:
+        with zipfile.ZipFile(fileobj or file_path, "r") as z:
             # ZIP BOMB PROTECTION
             SafeZipReader.validate(z)
             
@@ -75,36 +96,47 @@ def _scan_keras_h5(file_path: Path) -> List[str]:
         with h5py.File(file_path, "r") as f:
             if "model_config" in f.attrs:
                 config_str = f.attrs["model_config"]
-                if isinstance(config_str, bytes):
-                    config_str = config_str.decode("utf-8")
                 # H5 attributes are loaded into memory by h5py, usually safe-ish,
                 # but good to wrap in try-catch block handled by caller.
-                config_data = json.loads(config_str)
+                # Both parsers accept str and bytes, so no decode step is needed.
+                config_data = _json_loads(config_str)
                 threats.extend(_analyze_model_config(config_data))
     except Exception as e:
         logger.error(f"Error scanning Keras H5 {file_path}: {e}")
     return threats
 
+# Layer classes that wrap a nested model config
+NESTED_MODEL_CLASSES = {"Model", "Functional", "Sequential"}
+
 def _analyze_model_config(config: Dict[str, Any]) -> List[str]:
+    """
+    Walks the (possibly nested) model config looking for Lambda layers.
+    Iterative with an explicit queue: large configs nest models deeply, and a
+    recursive walk pays a Python frame per nested model.
+    """
     threats = []
-    # Handle both root config and nested 'config' key
-    model_config = config.get("config", config)
-    
-    # Some configs are lists (e.g. Sequential), some dicts
-    layers = model_config.get("layers", []) if isinstance(model_config, dict) else []
-    
-    if not isinstance(layers, list):
-        return []
-
-    for layer in layers:
-        if not isinstance(layer, dict): continue
-        class_name = layer.get("class_name")
-        
-        if class_name == "Lambda":
-            threats.append("CRITICAL: Keras Lambda layer detected (RCE Risk)")
-        
-        if class_name in ["Model", "Functional", "Sequential"]:
-            nested_config = layer.get("config", {})
-            threats.extend(_analyze_model_config(nested_config))
-            
+    pending = deque([config])
+    push, pop = pending.append, pending.popleft
+
+    while pending:
+        cfg = pop()
+        if not isinstance(cfg, dict):
+            continue
+        # Handle both root config and nested 'config' key
+        model_config = cfg.get("config", cfg)
+
+        # Some configs are lists (e.g. Sequential), some dicts
+        layers = model_config.get("layers", []) if isinstance(model_config, dict) else []
+        if not isinstance(layers, list):
+            continue
+
+        for layer in layers:
+            if not isinstance(layer, dict): continue
+            class_name = layer.get("class_name")
+
+            if class_name == "Lambda":
+                threats.append("CRITICAL: Keras Lambda layer detected (RCE Risk)")
+            elif class_name in NESTED_MODEL_CLASSES:
+                push(layer.get("config", {}))
+
     return threats
@@ -1,32 +1,69 @@
 # Copyright 2026 Veritensor Security Apache 2.0
 # Jupyter Notebook Scanner (.ipynb)
 
+import re
 import json
 import ast
 import logging
 from pathlib import Path
-from typing import List, Any
-import re
+from typing import List, Any, Optional, Set
 from veritensor.core.entropy import is_high_entropy
-from veritensor.engines.static.rules import get_severity, SignatureLoader, is_match
-from veritensor.engines.content.pii import PIIScanner  
+from veritensor.engines.static.rules import get_severity, SignatureLoader, get_matcher, compile_rule
+from veritensor.engines.content.pii import PIIScanner, MAX_PII_SCAN_SIZE  
 
 logger = logging.getLogger(__name__)
 
+# Incremental JSON parser for large notebooks (pip install veritensor[fast])
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Jupyter "Magic" commands that execute shell code
 DANGEROUS_MAGICS = [
     "!", "%%bash", "%%sh", "%%script", "%%perl", "%%ruby", "%system"
 ]
+# One anchored C-level test per line instead of a startswith() per magic
+_MAGIC_RE = re.compile("|".join(map(re.escape, DANGEROUS_MAGICS)))
 
 # Limit output scanning to prevent DoS on large logs (Critical for stability)
 MAX_OUTPUT_SCAN_SIZE = 50 * 1024  # 50 KB
 
+# Notebooks above this size are streamed cell by cell when ijson is installed
+NOTEBOOK_STREAM_THRESHOLD = 32 * 1024 * 1024
+
+# Distinct output hashes remembered per notebook for deduplication
+MAX_SEEN_OUTPUTS = 100_000
+
+# Joins a cell's outputs for the rule gate and Presidio. It does not stop every
+# pattern (a negated class like [^'"]+ crosses it), so rule details and entropy
+# are checked on each output separately
+OUTPUT_SEPARATOR = "\n\x00\n"
+
 def scan_notebook(file_path: Path) -> List[str]:
     """
     Parses .ipynb JSON and scans code, outputs, and markdown for threats.
     """
     threats = []
     try:
+        # Load signatures (compiled once per process)
+        secret_matcher = get_matcher(tuple(SignatureLoader.get_suspicious_strings()))
+        injection_matcher = get_matcher(tuple(SignatureLoader.get_prompt_injections()))
+        # Hashes of output texts already scanned in this notebook
+        seen_outputs = set()
+
+        # Notebooks with embedded outputs reach hundreds of MB; a full json.load
+        # needs several times that in RAM, so large files are parsed cell by cell
+        if IJSON_AVAILABLE and file_path.stat().st_size > NOTEBOOK_STREAM_THRESHOLD:
+            with open(file_path, "rb") as f:
+                try:
+                    for i, cell in enumerate(ijson.items(f, "cells.item")):
+                        threats.extend(_scan_cell(cell, i + 1, secret_matcher, injection_matcher, seen_outputs))
+                except ijson.JSONError:
+                    threats.append("WARNING: Invalid JSON in .ipynb file")
+            return threats
+
         with open(file_path, "r", encoding="utf-8", errors="replace") as f:
             try:
                 nb_data = json.load(f)
@@ -36,89 +73,8 @@ def scan_notebook(file_path: Path) -> List[str]:
         if "cells" not in nb_data:
             return []
 
-        # Load signatures
-        secret_patterns = SignatureLoader.get_suspicious_strings()
-        injection_patterns = SignatureLoader.get_prompt_injections()
-
         for i, cell in enumerate(nb_data["cells"]):
-            cell_num = i + 1
-            cell_type = cell.get("cell_type", "")
-            source_list = cell.get("source", [])
-            outputs_list = cell.get("outputs", [])
-            
-            source_text = _extract_text(source_list)
-
-            # --- A. Code Cells ---
-            if cell_type == "code":
-                # 1. Magics (Shell Injection)
-                for line in source_text.splitlines():
-                    stripped = line.strip()
-                    for magic in DANGEROUS_MAGICS:
-                        if stripped.startswith(magic):
-                            threats.append(f"HIGH: Jupyter Magic detected in cell {cell_num}: '{stripped[:30]}...'")
-
-                # 2. AST (Python Code Analysis)
-                clean_source = _clean_magics(source_text)
-                if clean_source.strip():
-                    threats.extend(_scan_ast(clean_source, cell_num))
-                
-                # 3. Output Secrets (Leaked Keys) & PII
-                for output in outputs_list:
-                    output_type = output.get("output_type")
-                    text_content = ""
-                    if output_type == "stream":
-                        text_content = _extract_text(output.get("text", []))
-                    elif output_type == "execute_result":
-                        data = output.get("data", {})
-                        text_content = _extract_text(data.get("text/plain", []))
-                    
-                    if text_content:
-                        # Optimization: Scan only the beginning of large outputs
-                        scan_content = text_content[:MAX_OUTPUT_SCAN_SIZE]
-                        
-                        # A. Secrets (Regex & Simple)
-                        if is_match(scan_content, secret_patterns):
-                            for pat in secret_patterns:
-                                # Case 1: Regex Pattern (Entropy Check)
-                                if pat.startswith("regex:"): 
-                                    regex_str = pat.replace("regex:", "", 1).strip()
-                                    try:
-                                        # Scan OUTPUT content
-                                        matches = re.findall(regex_str, scan_content, re.IGNORECASE)
-                                        for match in matches:
-                                            # If regex has groups (var, val) -> check entropy
-                                            if isinstance(match, tuple) and len(match) >= 2:
-                                                secret_candidate = match[1] 
-                                                if is_high_entropy(secret_candidate):
-                                                    threats.append(f"CRITICAL: High Entropy Secret detected in Cell {cell_num}: '{match[0]} = ...'")
-                                            # If regex has no groups (simple match) -> report match
-                                            elif isinstance(match, str):
-                                                threats.append(f"CRITICAL: Secret pattern detected in Cell {cell_num} Output: '{match[:50]}'")
-                                    except Exception:
-                                        pass
-                                
-                                # Case 2: Simple String Match (FIXED)
-                                else:
-                                    if pat in scan_content:
-                                        threats.append(f"CRITICAL: Leaked secret detected in Cell {cell_num} Output: '{pat}'")
-                        
-                        # B. PII (Presidio ML) 
-                        pii_threats = PIIScanner.scan(scan_content)
-                        if pii_threats:
-                            threats.extend([f"{t} in Cell {cell_num} Output" for t in pii_threats])
-                            
-            # --- B. Markdown Cells (RAG Security) ---
-            elif cell_type == "markdown":
-                # RAG Poisoning / Prompt Injection
-                if is_match(source_text, injection_patterns):
-                    for pat in injection_patterns:
-                        if is_match(source_text, [pat]):
-                            threats.append(f"HIGH: Prompt Injection detected in Markdown Cell {cell_num}: '{pat}'")
-                
-                # Phishing / XSS
-                lower_source = source_text.lower()
-                if "javascript:" in lower_source or "data:text/html" in lower_source:
-                      threats.append(f"MEDIUM: Suspicious script/XSS in Markdown Cell {cell_num}")
+            threats.extend(_scan_cell(cell, i + 1, secret_matcher, injection_matcher, seen_outputs))
 
     except Exception as e:
         logger.error(f"Failed to scan notebook {file_path}: {e}")
@@ -126,6 +82,80 @@ def scan_notebook(file_path: Path) -> List[str]:
 
     return threats
 
+def _scan_cell(cell: Any, cell_num: int, secret_matcher, injection_matcher, seen_outputs: Set[int]) -> List[str]:
+    """Scans one notebook cell (source, outputs) and returns its threats."""
+    threats = []
+    cell_type = cell.get("cell_type", "")
+    source_list = cell.get("source", [])
+    outputs_list = cell.get("outputs", [])
+
+    source_text = _extract_text(source_list)
+
+    # --- A. Code Cells ---
+    if cell_type == "code":
+        # 1. Magics (Shell Injection)
+        for line in source_text.splitlines():
+            stripped = line.strip()
+            if _MAGIC_RE.match(stripped):
+                threats.append(f"HIGH: Jupyter Magic detected in cell {cell_num}: '{stripped[:30]}...'")
+
+        # 2. AST (Python Code Analysis)
+        # Plain-Python cells (the common case) skip the line-by-line rebuild
+        if "!" in source_text or "%" in source_text:
+            clean_source = _clean_magics(source_text)
+        else:
+            clean_source = source_text
+        if clean_source.strip():
+            threats.extend(_scan_ast(clean_source, cell_num))
+
+        # 3. Output Secrets (Leaked Keys) & PII
+        # Outputs are gated per cell in a few joined buffers, not one by one
+        for parts in _group_outputs(outputs_list, seen_outputs):
+            scan_content = OUTPUT_SEPARATOR.join(parts)
+            # A. Secrets (Regex & Simple)
+            # Only rules that fired need the detailed pass below, per output
+            for pat, _ in secret_matcher.findall(scan_content):
+                # Case 1: Regex Pattern (Entropy Check)
+                if pat.startswith("regex:"): 
+                    regex_str = pat.replace("regex:", "", 1).strip()
+                    try:
+                        # Scan OUTPUT content
+                        regex = compile_rule(regex_str)
+                        for match in (m for part in parts for m in regex.findall(part)):
+                            # If regex has groups (var, val) -> check entropy
+                            if isinstance(match, tuple) and len(match) >= 2:
+                                secret_candidate = match[1] 
+                                if is_high_entropy(secret_candidate):
+                                    threats.append(f"CRITICAL: High Entropy Secret detected in Cell {cell_num}: '{match[0]} = ...'")
+                            # If regex has no groups (simple match) -> report match
+                            elif isinstance(match, str):
+                                threats.append(f"CRITICAL: Secret pattern detected in Cell {cell_num} Output: '{match[:50]}'")
+                    except Exception:
+                        pass
+
+                # Case 2: Simple String Match (FIXED)
+                else:
+                    if any(pat in part for part in parts):
+                        threats.append(f"CRITICAL: Leaked secret detected in Cell {cell_num} Output: '{pat}'")
+
+            # B. PII (Presidio ML) 
+            pii_threats = PIIScanner.scan(scan_content)
+            if pii_threats:
+                threats.extend([f"{t} in Cell {cell_num} Output" for t in pii_threats])
+
+    # --- B. Markdown Cells (RAG Security) ---
+    elif cell_type == "markdown":
+        # RAG Poisoning / Prompt Injection
+        for pat, _ in injection_matcher.findall(source_text):
+            threats.append(f"HIGH: Prompt Injection detected in Markdown Cell {cell_num}: '{pat}'")
+
+        # Phishing / XSS
+        lower_source = source_text.lower()
+        if "javascript:" in lower_source or "data:text/html" in lower_source:
+              threats.append(f"MEDIUM: Suspicious script/XSS in Markdown Cell {cell_num}")
+
+    return threats
+
 def _extract_text(content: Any) -> str:
     """Helper to handle both list of strings and single string formats."""
     if isinstance(content, list):
@@ -134,6 +164,48 @@ def _extract_text(content: Any) -> str:
         return content
     return ""
 
+def _group_outputs(outputs: List[Any], seen: Optional[Set[int]] = None) -> List[List[str]]:
+    """
+    Collects the text of a cell's outputs (each capped at MAX_OUTPUT_SCAN_SIZE)
+    into as few groups as possible, each gated as one joined buffer. Training
+    loops print hundreds of small outputs; scanning them together saves a matcher
+    and Presidio call per output. Joined groups stay within the PII scanner's
+    input limit, so no output goes unchecked.
+    Outputs whose text hash is in `seen` (repeated progress lines, warnings)
+    were already scanned and are skipped.
+    """
+    if seen is None:
+        seen = set()
+    groups, parts, size = [], [], 0
+    for output in outputs:
+        output_type = output.get("output_type")
+        text_content = ""
+        if output_type == "stream":
+            text_content = _extract_text(output.get("text", []))
+        elif output_type == "execute_result":
+            data = output.get("data", {})
+            text_content = _extract_text(data.get("text/plain", []))
+        if not text_content:
+            continue
+
+        # Optimization: Scan only the beginning of large outputs
+        part = text_content[:MAX_OUTPUT_SCAN_SIZE]
+        key = hash(part)
+        if key in seen:
+            continue
+        if len(seen) < MAX_SEEN_OUTPUTS:
+            seen.add(key)
+
+        if parts and size + len(OUTPUT_SEPARATOR) + len(part) > MAX_PII_SCAN_SIZE:
+            groups.append(parts)
+            parts, size = [], 0
+        size += len(part) + (len(OUTPUT_SEPARATOR) if parts else 0)
+        parts.append(part)
+
+    if parts:
+        groups.append(parts)
+    return groups
+
 def _clean_magics(source: str) -> str:
     """Replaces magics with comments to allow AST parsing while keeping line numbers."""
     lines = []
@@ -145,39 +217,48 @@ def _clean_magics(source: str) -> str:
             lines.append(line)
     return "\n".join(lines)
 
+def _check_import(node: ast.Import, cell_num: int, threats: List[str]):
+    for alias in node.names:
+        if get_severity(alias.name, "*") == "CRITICAL":
+            threats.append(f"CRITICAL: Unsafe import in cell {cell_num}: '{alias.name}'")
+
+def _check_import_from(node: ast.ImportFrom, cell_num: int, threats: List[str]):
+    if node.module and get_severity(node.module, "*") == "CRITICAL":
+        threats.append(f"CRITICAL: Unsafe import in cell {cell_num}: '{node.module}'")
+
+def _check_call(node: ast.Call, cell_num: int, threats: List[str]):
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        if isinstance(func.value, ast.Name):
+            module = func.value.id
+            method = func.attr
+            severity = get_severity(module, method)
+            if severity:
+                threats.append(f"{severity}: Dangerous call in cell {cell_num}: {module}.{method}()")
+    elif isinstance(func, ast.Name):
+        severity = get_severity("builtins", func.id)
+        if severity:
+            threats.append(f"{severity}: Dangerous call in cell {cell_num}: {func.id}()")
+
+# Node types worth inspecting. Every other node costs one dict miss instead of
+# a chain of isinstance() checks. ast.walk() is iterative, so deeply nested
+# cells cannot exhaust the stack the way a recursive NodeVisitor would.
+_NODE_CHECKS = {
+    ast.Import: _check_import,
+    ast.ImportFrom: _check_import_from,
+    ast.Call: _check_call,
+}
+
 def _scan_ast(code: str, cell_num: int) -> List[str]:
     threats = []
     try:
         tree = ast.parse(code)
-        
+
+        checks = _NODE_CHECKS.get
         for node in ast.walk(tree):
-            # Check Imports
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                names = []
-                if isinstance(node, ast.Import):
-                    names = [n.name for n in node.names]
-                elif isinstance(node, ast.ImportFrom) and node.module:
-                    names = [node.module]
-                
-                for name in names:
-                    severity = get_severity(name, "*")
-                    if severity == "CRITICAL":
-                        threats.append(f"CRITICAL: Unsafe import in cell {cell_num}: '{name}'")
-
-            # Check Function Calls
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Attribute):
-                    if isinstance(node.func.value, ast.Name):
-                        module = node.func.value.id
-                        method = node.func.attr
-                        severity = get_severity(module, method)
-                        if severity:
-                            threats.append(f"{severity}: Dangerous call in cell {cell_num}: {module}.{method}()")
-                elif isinstance(node.func, ast.Name):
-                    func_name = node.func.id
-                    severity = get_severity("builtins", func_name)
-                    if severity:
-                        threats.append(f"{severity}: Dangerous call in cell {cell_num}: {func_name}()")
+            check = checks(type(node))
+            if check:
+                check(node, cell_num, threats)
     except Exception:
         pass
     return threats
@@ -12,7 +12,7 @@ import zipfile
 from typing import List, Union, BinaryIO
 
 # Import dynamic rules loader and regex matcher
-from veritensor.engines.static.rules import get_severity, SignatureLoader, is_match
+from veritensor.engines.static.rules import get_severity, SignatureLoader, get_matcher
 from veritensor.core.safe_zip import SafeZipReader, ZipBombError
 
 logger = logging.getLogger(__name__)
@@ -66,18 +66,19 @@ def _is_safe_import(module: str, name: str) -> bool:
     
     return False
 
-def scan_pickle_stream(data: Union[bytes, BinaryIO], strict_mode: bool = True) -> List[str]:
+def scan_pickle_stream(data: Union[bytes, bytearray, memoryview, BinaryIO], strict_mode: bool = True) -> List[str]:
     """
     Disassembles a pickle stream (or Zip/Wheel) and checks for dangerous imports.
-    Supports both bytes (legacy) and file-like objects (streaming).
+    Supports any bytes-like buffer (legacy) and file-like objects (streaming).
     """
     threats = []
     
-    # Load signatures dynamically from YAML
+    # Load signatures dynamically from YAML (compiled once per process)
     suspicious_patterns = SignatureLoader.get_suspicious_strings()
+    suspicious_matcher = get_matcher(tuple(suspicious_patterns))
     
     # Prepare the stream
-    if isinstance(data, bytes):
+    if isinstance(data, (bytes, bytearray, memoryview)):
         stream = io.BytesIO(data)
     else:
         stream = data
@@ -117,10 +118,8 @@ def scan_pickle_stream(data: Union[bytes, BinaryIO], strict_mode: bool = True) -
                     try:
                         with z.open(script_name) as f:
                             content = f.read(1024 * 1024).decode('utf-8', errors='ignore')
-                            if is_match(content, suspicious_patterns):
-                                for pat in suspicious_patterns:
-                                    if is_match(content, [pat]):
-                                        threats.append(f"HIGH: Suspicious string in {script_name}: '{pat}'")
+                            for pat, _ in suspicious_matcher.findall(content):
+                                threats.append(f"HIGH: Suspicious string in {script_name}: '{pat}'")
                     except Exception:
                         continue
 
@@ -155,11 +154,9 @@ def scan_pickle_stream(data: Union[bytes, BinaryIO], strict_mode: bool = True) -
                 
                 # Check suspicious strings in pickle constants
                 if isinstance(arg, str) and suspicious_patterns:
-                    if is_match(arg, suspicious_patterns):
-                         for pat in suspicious_patterns:
-                            if is_match(arg, [pat]):
-                                safe_arg = arg[:50] + "..." if len(arg) > 50 else arg
-                                threats.append(f"HIGH: Suspicious string detected: '{pat}' in '{safe_arg}'")
+                    for pat, _ in suspicious_matcher.findall(arg):
+                        safe_arg = arg[:50] + "..." if len(arg) > 50 else arg
+                        threats.append(f"HIGH: Suspicious string detected: '{pat}' in '{safe_arg}'")
 
             elif opcode.name == "STOP":
                 memo.clear()
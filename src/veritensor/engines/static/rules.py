@@ -3,12 +3,31 @@
 
 import re
 import logging
+import threading
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any, Iterable, Tuple
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
 
 logger = logging.getLogger(__name__)
 
+# --- Optional RE2 Import ---
+# Linear-time regex engine: signatures may come from downloaded YAML and the
+# scanned text is attacker-controlled, so backtracking (ReDoS) is a real risk.
+try:
+    import re2
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.case_sensitive = False
+    _RE2_OPTIONS.log_errors = False
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 # Wildcard to indicate the entire module is unsafe
 ALL_FUNCTIONS = "*"
 
@@ -76,30 +95,35 @@ class SignatureLoader:
     3. Hardcoded Fallback - If files are missing
     """
     _instance = None
+    _lock = threading.Lock()
     _globals = DEFAULT_UNSAFE_GLOBALS
-    _suspicious = DEFAULT_SUSPICIOUS_STRINGS
-    _injections = DEFAULT_PROMPT_INJECTIONS
+    # Tuples: immutable and hashable, so callers can key compiled matchers
+    # (get_matcher) on them directly without copying per scanned file.
+    _suspicious: Tuple[str, ...] = tuple(DEFAULT_SUSPICIOUS_STRINGS)
+    _injections: Tuple[str, ...] = tuple(DEFAULT_PROMPT_INJECTIONS)
     
     @classmethod
-    def get_globals(cls) -> Dict[str, Dict[str, Any]]:
+    def _get_instance(cls) -> "SignatureLoader":
+        # Double-checked: the YAML is parsed once per process
         if cls._instance is None:
-            cls._instance = cls()
-            cls._instance._load()
-        return cls._instance._globals
+            with cls._lock:
+                if cls._instance is None:
+                    instance = cls()
+                    instance._load()
+                    cls._instance = instance
+        return cls._instance
 
     @classmethod
-    def get_suspicious_strings(cls) -> List[str]:
-        if cls._instance is None:
-            cls._instance = cls()
-            cls._instance._load()
-        return cls._instance._suspicious
+    def get_globals(cls) -> Dict[str, Dict[str, Any]]:
+        return cls._get_instance()._globals
+
+    @classmethod
+    def get_suspicious_strings(cls) -> Tuple[str, ...]:
+        return cls._get_instance()._suspicious
     
     @classmethod
-    def get_prompt_injections(cls) -> List[str]:
-        if cls._instance is None:
-            cls._instance = cls()
-            cls._instance._load()
-        return cls._instance._injections
+    def get_prompt_injections(cls) -> Tuple[str, ...]:
+        return cls._get_instance()._injections
 
     
     def _load(self):
@@ -122,11 +146,11 @@ class SignatureLoader:
                             
                             # Update suspicious strings if present
                             if "suspicious_strings" in data:
-                                self._suspicious = data["suspicious_strings"]
+                                self._suspicious = tuple(data["suspicious_strings"])
                             
                             # Update prompt injections if present
                             if "prompt_injections" in data:
-                                self._injections = data["prompt_injections"]
+                                self._injections = tuple(data["prompt_injections"])
                             
                             logger.debug(f"Loaded signatures from {path}")
                             
@@ -139,11 +163,26 @@ class SignatureLoader:
 
 # --- Severity Logic ---
 
+_severity_source: Optional[Dict[str, Dict[str, Any]]] = None
+
 def get_severity(module: str, name: str) -> Optional[str]:
     """
     Checks a module.function pair against the blocklist.
     Returns the severity level (CRITICAL, HIGH, etc.) or None.
     """
+    global _severity_source
+    unsafe_globals = SignatureLoader.get_globals()
+    # Lookups are memoized per signature set; drop them if the set was replaced
+    if unsafe_globals is not _severity_source:
+        _lookup_severity.cache_clear()
+        _severity_source = unsafe_globals
+    return _lookup_severity(module, name)
+
+
+@lru_cache(maxsize=8192)
+def _lookup_severity(module: str, name: str) -> Optional[str]:
+    # Module and function names come from a small vocabulary, so notebooks and
+    # pickles re-query the same few pairs for every import and call.
     unsafe_globals = SignatureLoader.get_globals()
 
     for severity in ["CRITICAL", "HIGH", "MEDIUM", "LOW"]:
@@ -179,28 +218,159 @@ def is_match(value: str, patterns: List[str]) -> bool:
     """
     if not value:
         return False
-        
-    for pattern in patterns:
-        # --- Mode 1: Regex ---
-        if pattern.startswith("regex:") or pattern.startswith("pattern:"):
-            # Strip prefix (e.g. "regex:^meta-.*")
-            regex_str = pattern.split(":", 1)[1]
-            try:
-                if re.search(regex_str, value, re.IGNORECASE):
-                    return True
-            except re.error:
-                # Log error but don't crash scan
-                logger.warning(f"Invalid regex pattern in config/signatures: {regex_str}")
-                continue
-        
-        # --- Mode 2: Simple Substring (Default) ---
-        else:
-            if pattern.lower() in value.lower():
-                return True
-            
-    return False
+
+    # Same compiled, cached rule set as the content scanners
+    return get_matcher(tuple(patterns)).search(value) is not None
 
 def is_license_restricted(license_str: str, custom_list: List[str] = None) -> bool:
     """Checks if a license string matches restricted rules."""
     patterns = custom_list if custom_list else DEFAULT_RESTRICTED_LICENSES
     return is_match(license_str, patterns)
+
+
+
+# --- Multi-Pattern Matcher ---
+
+@lru_cache(maxsize=1024)
+def compile_rule(regex_str: str):
+    """
+    Compiles a rule case-insensitively, preferring RE2 (guaranteed linear time).
+    Rules RE2 cannot express (lookarounds, backreferences) fall back to stdlib re.
+    Raises re.error if the rule is invalid for both engines.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(regex_str, _RE2_OPTIONS)
+        except re2.error:
+            pass
+    return re.compile(regex_str, re.IGNORECASE)
+
+def is_linear_time(compiled) -> bool:
+    """True if the compiled rule runs on RE2 and cannot backtrack."""
+    return not isinstance(compiled, re.Pattern)
+
+def _rule_to_regex(pattern: str) -> str:
+    """Converts a signature (substring or 'regex:'/'pattern:' rule) to a regex string."""
+    if pattern.startswith("regex:") or pattern.startswith("pattern:"):
+        return pattern.split(":", 1)[1]
+    return re.escape(pattern)
+
+
+# Literals shorter than this occur in almost any text and make a useless prefilter.
+MIN_PREFILTER_LITERAL = 3
+
+def required_literal(regex_str: str) -> Optional[str]:
+    """
+    Returns the longest lowercase ASCII literal that every match of the regex
+    must contain, or None if the rule has no usable one.
+    Only top-level literal runs are considered, which keeps the result sound:
+    anything under a branch, repeat or group may be skipped by a match.
+    """
+    try:
+        parsed = sre_parse.parse(regex_str)
+    except Exception:
+        return None
+
+    best, run = "", []
+    for op, av in list(parsed) + [(None, None)]:
+        if op is sre_parse.LITERAL and av < 128:
+            run.append(chr(av).lower())
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+
+    return best if len(best) >= MIN_PREFILTER_LITERAL else None
+
+
+class SignatureMatcher:
+    """
+    Compiles a signature list once and reports which rule fired.
+
+    Replaces the "is_match(text, all) -> for pat: is_match(text, [pat])" idiom,
+    which re-ran every pattern (and re-lowercased the text) just to attribute a hit.
+    Rules stay separate regexes: a single alternation defeats the literal-prefix
+    scan that CPython's re applies to each pattern and is several times slower.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(patterns)
+        self._compiled: List[Tuple[str, "re.Pattern"]] = []
+
+        for pattern in self.patterns:
+            regex_str = _rule_to_regex(pattern)
+            try:
+                self._compiled.append((pattern, compile_rule(regex_str)))
+            except re.error:
+                logger.warning(f"Invalid regex pattern in config/signatures: {regex_str}")
+
+        # With RE2 for every rule there is no backtracking, so callers may
+        # scan full-length input instead of truncating it for ReDoS safety.
+        self.linear_time = all(is_linear_time(c) for _, c in self._compiled)
+
+        # Most texts contain none of the rules' fixed substrings. A plain substring
+        # test per rule is much cheaper than a case-insensitive regex walk, which
+        # gets no literal-prefix acceleration from CPython's re.
+        self._literals = [required_literal(_rule_to_regex(p)) for p, _ in self._compiled]
+        self._prefilter = any(self._literals)
+        self._literal_free = [rule for rule, literal in zip(self._compiled, self._literals) if literal is None]
+        # Distinct required literals, for callers that screen whole batches at once
+        self.literals: Tuple[str, ...] = tuple(dict.fromkeys(filter(None, self._literals)))
+
+    def _candidates(self, text: str, screened: bool = False) -> List[Tuple[str, "re.Pattern"]]:
+        """Rules that can still match `text` after the literal prefilter."""
+        if screened:
+            return self._literal_free
+
+        # Case-insensitive matching folds a few non-ASCII letters onto ASCII
+        # ones (e.g. the Kelvin sign), which lower() would not; skip those texts.
+        if not self._prefilter or not text.isascii():
+            return self._compiled
+
+        folded = text.lower()
+        return [
+            rule for rule, literal in zip(self._compiled, self._literals)
+            if literal is None or literal in folded
+        ]
+
+    def search(self, text: str, screened: bool = False) -> Optional[Tuple[str, str]]:
+        """
+        Returns (signature, matched_text) for the first rule that hits, or None.
+        screened=True means the caller already verified that `text` is ASCII and
+        contains none of `literals` (case-insensitive), so only rules without a
+        required literal are run.
+        """
+        if not text:
+            return None
+
+        for pattern, compiled in self._candidates(text, screened):
+            match = compiled.search(text)
+            if match:
+                return pattern, match.group(0)
+
+        return None
+
+    def findall(self, text: str, screened: bool = False) -> List[Tuple[str, str]]:
+        """
+        Returns (signature, matched_text) for every rule that hits, in rule order.
+        See search() for `screened`.
+        """
+        if not text:
+            return []
+
+        hits = []
+        for pattern, compiled in self._candidates(text, screened):
+            match = compiled.search(text)
+            if match:
+                hits.append((pattern, match.group(0)))
+        return hits
+
+
+@lru_cache(maxsize=32)
+def get_matcher(patterns: Tuple[str, ...]) -> SignatureMatcher:
+    """
+    Returns a cached SignatureMatcher for a signature list.
+    Keyed on the pattern contents, so each worker compiles a list once per
+    process rather than once per scanned file.
+    """
+    return SignatureMatcher(patterns)
@@ -11,7 +11,7 @@ import logging
 import subprocess
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +29,23 @@ def sign_container(
     """
     Signs a container image using a private key.
     """
+    return sign_containers([image_ref], key_path, annotations=annotations, tlog_upload=tlog_upload)
+
+
+def sign_containers(
+    image_refs: List[str],
+    key_path: str,
+    annotations: Optional[Dict[str, str]] = None,
+    tlog_upload: bool = False
+) -> bool:
+    """
+    Signs several container images with one 'cosign sign' invocation.
+    cosign accepts multiple refs, so the Go runtime start-up, key decryption
+    and password prompt are paid once per batch instead of once per image.
+    """
+    if not image_refs:
+        return True
+
     if not is_cosign_available():
         logger.error("Cosign binary not found. Please install it or use the Veritensor Docker image.")
         return False
@@ -49,11 +66,12 @@ def sign_container(
         for key, value in annotations.items():
             cmd.extend(["-a", f"{key}={value}"])
 
-    # Target Image
-    cmd.append(image_ref)
+    # Target Images
+    cmd.extend(image_refs)
+    targets = ", ".join(image_refs)
 
     try:
-        logger.info(f"Signing image {image_ref} with key {key_path}...")
+        logger.info(f"Signing image(s) {targets} with key {key_path}...")
         
         # We allow direct interaction (stdin/stdout) so the user can type the password.
         # Note: In CI/CD, use COSIGN_PASSWORD env var to avoid prompts.
@@ -65,7 +83,7 @@ def sign_container(
         )
 
         if result.returncode == 0:
-            logger.info(f"Successfully signed {image_ref}")
+            logger.info(f"Successfully signed {targets}")
             return True
         else:
             logger.error(f"Cosign signing failed (Code {result.returncode})")
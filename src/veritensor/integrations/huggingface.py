@@ -6,7 +6,8 @@
 
 import requests
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+from veritensor.core.cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,32 @@ class HuggingFaceClient:
         self.headers = {}
         if self.token:
             self.headers["Authorization"] = f"Bearer {self.token}"
+        self.cache = ResponseCache()
+
+    def _get_json(self, url: str, params: Optional[Dict[str, str]] = None) -> Tuple[int, Any]:
+        """
+        GET with the on-disk response cache. Returns (status_code, json_body).
+        Fresh entries skip the network; stale ones are revalidated via ETag.
+        """
+        key = ResponseCache.make_key(url, params, self.token)
+        entry = self.cache.get(key)
+        if entry and self.cache.is_fresh(entry):
+            return 200, entry["body"]
+
+        headers = dict(self.headers)
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+
+        resp = requests.get(url, headers=headers, params=params, timeout=10)
+        if resp.status_code == 304 and entry:
+            self.cache.set(key, entry["etag"], entry["body"])
+            return 200, entry["body"]
+        if resp.status_code != 200:
+            return resp.status_code, None
+
+        body = resp.json()
+        self.cache.set(key, resp.headers.get("ETag"), body)
+        return 200, body
 
     def get_model_info(self, repo_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -25,20 +52,55 @@ class HuggingFaceClient:
         """
         url = f"{HF_API_BASE}/{repo_id}"
         try:
-            resp = requests.get(url, headers=self.headers, timeout=10)
-            if resp.status_code == 200:
-                return resp.json()
-            elif resp.status_code == 401:
+            status, body = self._get_json(url)
+            if status == 200:
+                return body
+            elif status == 401:
                 logger.warning(f"Access denied to {repo_id}. Check your HF_TOKEN.")
-            elif resp.status_code == 404:
+            elif status == 404:
                 logger.warning(f"Model {repo_id} not found on Hugging Face.")
             else:
-                logger.warning(f"HF API Error: {resp.status_code}")
+                logger.warning(f"HF API Error: {status}")
         except Exception as e:
             logger.error(f"Network error connecting to HF: {e}")
         
         return None
 
+    def get_file_manifest(self, repo_id: str) -> Optional[Dict[str, str]]:
+        """
+        Fetches the SHA256 of every LFS file in the repo with a single API call.
+        Returns {filename: sha256}, or None if the repo could not be queried.
+        """
+        url = f"{HF_API_BASE}/{repo_id}"
+        try:
+            status, body = self._get_json(url, params={"blobs": "true"})
+            if status != 200:
+                logger.warning(f"Could not fetch file list for {repo_id} (HTTP {status}).")
+                return None
+            siblings = body.get("siblings", [])
+        except Exception as e:
+            logger.error(f"Network error connecting to HF: {e}")
+            return None
+
+        manifest = {}
+        for file_obj in siblings:
+            lfs = file_obj.get("lfs") or {}
+            # 'sha256' with ?blobs=true, 'oid' on the tree/paths-info endpoints
+            remote_hash = lfs.get("sha256") or lfs.get("oid")
+            if file_obj.get("rfilename") and remote_hash:
+                manifest[file_obj["rfilename"]] = remote_hash
+        return manifest
+
+    @staticmethod
+    def verify_against_manifest(manifest: Dict[str, str], filename: str, local_sha256: str) -> str:
+        """
+        Offline counterpart of verify_file_hash() for a manifest fetched once per scan.
+        """
+        remote_hash = manifest.get(filename)
+        if not remote_hash:
+            return "UNKNOWN"
+        return "VERIFIED" if remote_hash == local_sha256 else "MISMATCH"
+
     def get_model_license(self, repo_id: str) -> Optional[str]:
         """
         Fetches license information from the Hugging Face Model Card (API).
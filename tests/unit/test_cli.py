@@ -2,6 +2,7 @@ import pytest
 from typer.testing import CliRunner
 from unittest.mock import MagicMock, patch
 from pathlib import Path
+from veritensor.cli import main
 from veritensor.cli.main import app
 from veritensor.core.types import ScanResult
 
@@ -26,59 +27,108 @@ def mock_as_completed(mocker):
     """
     return mocker.patch("concurrent.futures.as_completed")
 
-def test_scan_local_file_clean(tmp_path, mock_executor, mock_as_completed):
+@pytest.fixture
+def mock_worker(mocker):
+    """
+    Single-file scans run in-process, so the worker itself is mocked.
+    """
+    return mocker.patch("veritensor.cli.main.scan_worker")
+
+def test_scan_local_file_clean(tmp_path, mock_worker, mock_executor):
     f = tmp_path / "model.pkl"
     f.write_text("fake pickle content")
 
     # Setup Mock Result
     fake_result = ScanResult(str(f), status="PASS")
     fake_result.file_hash = "sha256:12345"
-    
-    mock_future = MagicMock()
-    mock_future.result.return_value = fake_result
-    
-    # Configure the mocks
-    mock_executor.submit.return_value = mock_future
-    mock_as_completed.return_value = [mock_future]
+    mock_worker.return_value = fake_result
 
     result = runner.invoke(app, ["scan", str(f)])
 
     assert result.exit_code == 0
     assert "Scan Passed" in result.stdout
+    # A single file is scanned in-process, without spawning a pool
+    mock_executor.submit.assert_not_called()
+
+def test_scan_directory_uses_pool(tmp_path, mock_executor, mock_as_completed):
+    for name in ("a.pkl", "b.pkl"):
+        (tmp_path / name).write_text("fake pickle content")
+
+    futures = []
+    for name in ("a.pkl", "b.pkl"):
+        mock_future = MagicMock()
+        mock_future.result.return_value = ScanResult(str(tmp_path / name), status="PASS")
+        futures.append(mock_future)
+
+    mock_executor.submit.side_effect = futures
+    mock_as_completed.return_value = futures
+
+    result = runner.invoke(app, ["scan", str(tmp_path), "--jobs", "2"])
+
+    assert result.exit_code == 0
+    assert mock_executor.submit.call_count == 2
+
+def test_scan_pool_warms_signatures(tmp_path, mocker):
+    for name in ("a.pkl", "b.pkl"):
+        (tmp_path / name).write_text("fake pickle content")
+    mock_pool = mocker.patch("concurrent.futures.ProcessPoolExecutor")
+    mocker.patch("concurrent.futures.as_completed", return_value=[])
+
+    runner.invoke(app, ["scan", str(tmp_path), "--jobs", "2"])
+
+    _, kwargs = mock_pool.call_args
+    assert kwargs["max_workers"] == 2
+    assert kwargs["initializer"] is main._init_worker
 
-def test_scan_malware_blocking(tmp_path, mock_executor, mock_as_completed):
+def test_scan_malware_blocking(tmp_path, mock_worker):
     f = tmp_path / "evil.pkl"
     f.write_text("malware")
 
     fake_result = ScanResult(str(f), status="FAIL")
     fake_result.add_threat("CRITICAL: RCE Detected")
-    
-    mock_future = MagicMock()
-    mock_future.result.return_value = fake_result
-    
-    mock_executor.submit.return_value = mock_future
-    mock_as_completed.return_value = [mock_future]
+    mock_worker.return_value = fake_result
 
     result = runner.invoke(app, ["scan", str(f)])
 
     assert result.exit_code == 1
     assert "BLOCKING DEPLOYMENT" in result.stdout
 
-def test_scan_ignore_malware(tmp_path, mock_executor, mock_as_completed):
+def test_scan_ignore_malware(tmp_path, mock_worker):
     f = tmp_path / "evil.pkl"
     f.write_text("malware")
 
     fake_result = ScanResult(str(f), status="FAIL")
     fake_result.add_threat("CRITICAL: RCE Detected")
-    
-    mock_future = MagicMock()
-    mock_future.result.return_value = fake_result
-    
-    mock_executor.submit.return_value = mock_future
-    mock_as_completed.return_value = [mock_future]
+    mock_worker.return_value = fake_result
 
     result = runner.invoke(app, ["scan", str(f), "--ignore-malware"])
 
     assert result.exit_code == 0
     # FIX: Updated expected string
     assert "SECURITY RISKS DETECTED" in result.stdout
+
+def test_iter_files_matches_rglob(tmp_path):
+    from veritensor.cli.main import _iter_files
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "top.pkl").write_bytes(b"x")
+    (tmp_path / "a" / ".hidden").write_text("x")
+    (tmp_path / "a" / "b" / "deep.py").write_text("x")
+    (tmp_path / "link").symlink_to(tmp_path / "a", target_is_directory=True)
+
+    expected = {str(p) for p in tmp_path.rglob("*") if p.is_file()}
+    assert set(_iter_files(tmp_path)) == expected
+    assert len(expected) == 3
+
+def test_scan_json_output(tmp_path, mock_worker):
+    import json
+    f = tmp_path / "model.pkl"
+    f.write_text("fake pickle content")
+    fake_result = ScanResult(str(f), status="PASS", file_hash="abc")
+    mock_worker.return_value = fake_result
+
+    result = runner.invoke(app, ["scan", str(f), "--json"])
+
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout[result.stdout.index("["):])
+    assert payload[0]["file_path"] == str(f)
+    assert payload[0]["file_hash"] == "abc"
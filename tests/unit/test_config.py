@@ -0,0 +1,28 @@
+import pickle
+import dataclasses
+import threading
+import pytest
+from veritensor.core.config import ConfigLoader, VeritensorConfig
+
+def test_config_is_immutable_and_picklable():
+    config = VeritensorConfig(allowed_models=["org/model"])
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.fail_on_severity = "LOW"
+    assert pickle.loads(pickle.dumps(config)) == config
+
+def test_concurrent_load_parses_once(mocker, monkeypatch, tmp_path):
+    monkeypatch.setattr(ConfigLoader, "_instance", None)
+    build = mocker.spy(ConfigLoader, "_build")
+    barrier = threading.Barrier(8)
+    results = []
+
+    def load():
+        barrier.wait()
+        results.append(ConfigLoader.load(tmp_path / "veritensor.yaml"))
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+
+    assert build.call_count == 1
+    assert all(r is results[0] for r in results)
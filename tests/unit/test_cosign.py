@@ -30,3 +30,18 @@ def test_sign_container_success(mock_exists, mock_avail, mock_run):
     assert "-a" in args
     assert "scanned_by=veritensor" in args
     assert "status=clean" in args
+
+
+@patch("veritensor.integrations.cosign.subprocess.run")
+@patch("veritensor.integrations.cosign.is_cosign_available", return_value=True)
+@patch("pathlib.Path.exists", return_value=True)
+def test_sign_containers_single_invocation(mock_exists, mock_avail, mock_run):
+    from veritensor.integrations.cosign import sign_containers
+    mock_run.return_value = MagicMock(returncode=0)
+
+    assert sign_containers(["img-a:v1", "img-b:v1"], "key.pem", annotations={"status": "clean"}) is True
+
+    mock_run.assert_called_once()
+    args = mock_run.call_args[0][0]
+    assert args[-2:] == ["img-a:v1", "img-b:v1"]
+    assert "status=clean" in args
@@ -23,3 +23,21 @@ def test_calculate_sha256_lfs_pointer(tmp_path):
     # Veritensor should return the OID from the text, not the hash of the text itself!
     expected_oid = "1111111111111111111111111111111111111111111111111111111111111111"
     assert calculate_sha256(f) == expected_oid
+
+def test_calculate_sha256_multi_chunk_and_stream(tmp_path):
+    import hashlib
+    import io
+    # Larger than the chunk size, so the loop runs more than once
+    data = bytes(range(256)) * 5000
+    f = tmp_path / "shard.bin"
+    f.write_bytes(data)
+    expected = hashlib.sha256(data).hexdigest()
+
+    assert calculate_sha256(f, chunk_size=4096) == expected
+    # File-like objects are hashed from the current position and rewound afterwards
+    stream = io.BytesIO(data)
+    assert calculate_sha256(stream) == expected
+    assert stream.tell() == 0
+    stream.seek(6)
+    assert calculate_sha256(stream, chunk_size=4096) == hashlib.sha256(data[6:]).hexdigest()
+    assert stream.tell() == 6
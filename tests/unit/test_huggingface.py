@@ -0,0 +1,36 @@
+from unittest.mock import MagicMock
+from veritensor.integrations.huggingface import HuggingFaceClient
+
+MANIFEST = {"siblings": [{"rfilename": "model.bin", "lfs": {"sha256": "abc"}}]}
+
+def _response(status, body=None, etag=None):
+    resp = MagicMock(status_code=status, headers={"ETag": etag} if etag else {})
+    resp.json.return_value = body
+    return resp
+
+def test_manifest_served_from_cache(mocker):
+    mock_get = mocker.patch("veritensor.integrations.huggingface.requests.get",
+                            return_value=_response(200, MANIFEST, etag='"v1"'))
+
+    assert HuggingFaceClient().get_file_manifest("org/model") == {"model.bin": "abc"}
+    # A second client (new CLI run) within the TTL does not touch the network
+    assert HuggingFaceClient().get_file_manifest("org/model") == {"model.bin": "abc"}
+    assert mock_get.call_count == 1
+
+def test_stale_entry_revalidated_with_etag(mocker):
+    mock_get = mocker.patch("veritensor.integrations.huggingface.requests.get",
+                            return_value=_response(200, MANIFEST, etag='"v1"'))
+    HuggingFaceClient().get_file_manifest("org/model")
+
+    client = HuggingFaceClient()
+    client.cache.ttl = 0
+    mock_get.return_value = _response(304)
+    assert client.get_file_manifest("org/model") == {"model.bin": "abc"}
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+def test_cache_is_scoped_to_token(mocker):
+    mock_get = mocker.patch("veritensor.integrations.huggingface.requests.get",
+                            return_value=_response(200, MANIFEST))
+    HuggingFaceClient(token="a").get_file_manifest("org/private")
+    HuggingFaceClient(token="b").get_file_manifest("org/private")
+    assert mock_get.call_count == 2
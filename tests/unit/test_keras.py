@@ -0,0 +1,40 @@
+import pytest
+import json
+import zipfile
+from veritensor.engines.static.keras_engine import scan_keras_file, _analyze_model_config
+
+def _lambda_config(depth: int):
+    """Builds a model config with a Lambda layer nested `depth` models deep."""
+    config = {"layers": [{"class_name": "Lambda", "config": {}}]}
+    for _ in range(depth):
+        config = {"layers": [{"class_name": "Sequential", "config": config}]}
+    return {"class_name": "Functional", "config": config}
+
+def test_keras_zip_lambda_detection(tmp_path):
+    f = tmp_path / "model.keras"
+    with zipfile.ZipFile(f, "w") as z:
+        z.writestr("config.json", json.dumps(_lambda_config(1)))
+
+    threats = scan_keras_file(f)
+    assert any("Lambda" in t for t in threats)
+
+def test_keras_deeply_nested_lambda():
+    """Deep nesting must not hide a Lambda layer (no recursion limit)."""
+    threats = _analyze_model_config(_lambda_config(5000))
+    assert threats == ["CRITICAL: Keras Lambda layer detected (RCE Risk)"]
+
+def test_keras_clean_config():
+    config = {"config": {"layers": [{"class_name": "Dense"}, {"class_name": "Dropout"}]}}
+    assert _analyze_model_config(config) == []
+
+def test_keras_h5_zip_polyglot(tmp_path):
+    """An HDF5 header in front of a zip archive must not hide the archive."""
+    inner = tmp_path / "inner.zip"
+    with zipfile.ZipFile(inner, "w") as z:
+        z.writestr("config.json", json.dumps(_lambda_config(0)))
+
+    f = tmp_path / "polyglot.h5"
+    f.write_bytes(b"\x89HDF\r\n\x1a\n" + inner.read_bytes())
+
+    threats = scan_keras_file(f)
+    assert any("Lambda" in t for t in threats)
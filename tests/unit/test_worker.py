@@ -1,3 +1,4 @@
+import hashlib
 import pytest
 from pathlib import Path
 from veritensor.cli.main import scan_worker
@@ -12,8 +13,8 @@ def test_worker_detects_pickle(tmp_path):
 
     config = VeritensorConfig()
     
-    # Args: (path, config, repo, ignore_license, full_scan, is_s3)
-    args = (str(f), config, None, False, False, False)
+    # Args: (path, config, repo, ignore_license, full_scan, is_s3, remote_hashes)
+    args = (str(f), config, None, False, False, False, None)
     
     result = scan_worker(args)
     
@@ -27,10 +28,88 @@ def test_worker_s3_logic(mocker):
     mock_hash = mocker.patch("veritensor.cli.main.calculate_sha256")
     
     config = VeritensorConfig()
-    args = ("s3://bucket/model.pkl", config, None, False, False, True)
+    args = ("s3://bucket/model.pkl", config, None, False, False, True, None)
     
     result = scan_worker(args)
     
     # Ensure local hashing was skipped
     mock_hash.assert_not_called()
     assert result.file_path == "s3://bucket/model.pkl"
+
+def test_worker_hashes_and_scans_same_handle(infected_pickle_path):
+    # The hash and the pickle scan share one file handle; both must see the full file
+    config = VeritensorConfig()
+    args = (str(infected_pickle_path), config, None, False, False, False, None)
+
+    result = scan_worker(args)
+
+    assert result.file_hash == hashlib.sha256(infected_pickle_path.read_bytes()).hexdigest()
+    assert result.status == "FAIL"
+
+def test_worker_verifies_against_manifest(tmp_path):
+    f = tmp_path / "model.bin"
+    f.write_bytes(b"weights" * 1000)
+    local_hash = hashlib.sha256(f.read_bytes()).hexdigest()
+    config = VeritensorConfig()
+
+    ok = scan_worker((str(f), config, "org/model", False, False, False, {"model.bin": local_hash}))
+    assert ok.identity_verified is True
+
+    bad = scan_worker((str(f), config, "org/model", False, False, False, {"model.bin": "0" * 64}))
+    assert bad.identity_verified is False
+    assert "CRITICAL: Hash mismatch! File differs from 'org/model'" in bad.threats
+
+    pointer = tmp_path / "pointer.bin"
+    pointer.write_text("version https://git-lfs.github.com/spec/v1\n")
+    lfs = scan_worker((str(pointer), config, "org/model", False, False, False, {"pointer.bin": "0" * 64}))
+    assert any("Likely Git LFS pointer" in t for t in lfs.threats)
+
+def test_worker_dispatch_routes(mocker, tmp_path):
+    # Extension routes win over filename routes; unsupported S3 engines warn instead of scanning
+    mock_doc = mocker.patch("veritensor.cli.main.scan_document", return_value=[])
+    mock_deps = mocker.patch("veritensor.cli.main.scan_dependencies", return_value=[])
+    config = VeritensorConfig()
+
+    req = tmp_path / "requirements.txt"
+    req.write_text("torch\n")
+    scan_worker((str(req), config, None, True, False, False, None))
+    mock_doc.assert_called_once()
+    mock_deps.assert_not_called()
+
+    pipfile = tmp_path / "Pipfile"
+    pipfile.write_text("[packages]\n")
+    scan_worker((str(pipfile), config, None, True, False, False, None))
+    mock_deps.assert_called_once()
+
+    result = scan_worker(("s3://bucket/model.keras", config, None, True, False, True, None))
+    assert "WARNING: S3 scanning not supported for Keras yet." in result.threats
+
+@pytest.mark.skipif(not hasattr(__import__("os"), "posix_fadvise"), reason="posix_fadvise not available")
+def test_worker_requests_readahead(mocker, tmp_path):
+    import os
+    spy = mocker.spy(os, "posix_fadvise")
+    f = tmp_path / "model.pkl"
+    f.write_bytes(b"\x80\x04N.")
+
+    scan_worker((str(f), VeritensorConfig(), None, True, False, False, None))
+
+    advice = {call.args[3] for call in spy.call_args_list}
+    assert {os.POSIX_FADV_SEQUENTIAL, os.POSIX_FADV_WILLNEED} <= advice
+
+@pytest.mark.skipif(not hasattr(__import__("os"), "posix_fadvise"), reason="posix_fadvise not available")
+def test_readahead_stays_within_window(mocker):
+    import time
+    from veritensor.core import streaming
+    fetched = []
+    mocker.patch.object(streaming, "prefetch_file", side_effect=fetched.append)
+    paths = [f"f{i}" for i in range(10)]
+
+    readahead = streaming.Readahead(paths, window=3).start()
+    time.sleep(0.05)
+    assert fetched == paths[:3]
+
+    readahead.advance()
+    readahead.advance()
+    time.sleep(0.05)
+    assert fetched == paths[:5]
+    readahead.close()